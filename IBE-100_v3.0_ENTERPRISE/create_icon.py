@@ -14,14 +14,8 @@ def create_icon():
         # Create icon sizes (Windows supports multiple sizes in one ico file)
         sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
         
-        # Resize and store images
-        icons = []
-        for size in sizes:
-            resized = img.resize(size, Image.Resampling.LANCZOS)
-            icons.append(resized)
-        
-        # Save as ICO file
-        img.save("logo.ico", format='ICO', sizes=[(s.width, s.height) for s in icons])
+        # Save as ICO file; Pillow resamples each size from the source itself
+        img.save("logo.ico", format='ICO', sizes=sizes)
         print(f"[SUCCESS] Created logo.ico with sizes: {[s for s in sizes]}")
         
         return True
@@ -3,148 +3,215 @@ Feature Check Script
 Verifies all features are properly integrated
 """
 
+import importlib
+import importlib.util
+import io
+import mmap
+import os
+import re
 import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-def check_imports():
+_IMPORT_CHECKS = (
+    ("src.services", (
+        "StreamAnalyzerService", "BitrateMonitorService", "EPGService",
+        "StreamMetrics", "ComplianceReport", "BitratePoint", "EPGEvent",
+    ), "Services"),
+    ("src.ui.widgets", (
+        "StreamQualityWidget", "BitrateMonitorWidget", "EPGEditorWidget",
+    ), "Widgets"),
+)
+
+def _describe(error):
+    """Format an exception as one line, without walking the stack"""
+    return "".join(traceback.format_exception_only(type(error), error)).strip()
+
+def check_imports(out=None):
     """Check all imports"""
-    print("[CHECK] Checking imports...")
+    out = out or sys.stdout
+    print("[CHECK] Checking imports...", file=out)
     errors = []
     
-    try:
-        from src.services import (
-            StreamAnalyzerService, BitrateMonitorService, EPGService,
-            StreamMetrics, ComplianceReport, BitratePoint, EPGEvent
-        )
-        print("  [OK] Services imported")
-    except Exception as e:
-        errors.append(f"Services import: {e}")
-        print(f"  [ERROR] Services import failed: {e}")
-    
-    try:
-        from src.ui.widgets import (
-            StreamQualityWidget, BitrateMonitorWidget, EPGEditorWidget
-        )
-        print("  [OK] Widgets imported")
-    except Exception as e:
-        errors.append(f"Widgets import: {e}")
-        print(f"  [ERROR] Widgets import failed: {e}")
+    for package, names, label in _IMPORT_CHECKS:
+        try:
+            # The packages resolve names lazily, so only the checked names load
+            module = importlib.import_module(package)
+            missing = [name for name in names if getattr(module, name, None) is None]
+            if missing:
+                raise ImportError(f"unavailable: {', '.join(missing)}")
+            print(f"  [OK] {label} imported", file=out)
+        except Exception as e:
+            errors.append(f"{label} import: {e}")
+            print(f"  [ERROR] {label} import failed: {e}", file=out)
     
     return errors
 
-def check_services():
+def check_services(out=None):
     """Check service initialization"""
-    print("\n[CHECK] Checking service initialization...")
+    out = out or sys.stdout
+    print("\n[CHECK] Checking service initialization...", file=out)
     errors = []
     
     try:
-        from src.services.tsduck_service import TSDuckService
-        from src.services.telegram_service import TelegramService
+        from src.services import TSDuckService, TelegramService
         
         # Mock services for testing
         tsduck = TSDuckService()
         telegram = TelegramService()
-        
-        from src.services.stream_analyzer_service import StreamAnalyzerService
-        analyzer = StreamAnalyzerService(tsduck, telegram)
-        print("  [OK] StreamAnalyzerService initialized")
-        
-        from src.services.bitrate_monitor_service import BitrateMonitorService
-        monitor = BitrateMonitorService(tsduck, telegram)
-        print("  [OK] BitrateMonitorService initialized")
-        
-        from src.services.epg_service import EPGService
-        epg = EPGService()
-        print("  [OK] EPGService initialized")
-        
     except Exception as e:
-        errors.append(f"Service initialization: {e}")
-        print(f"  [ERROR] Service initialization failed: {e}")
-        import traceback
-        traceback.print_exc()
+        errors.append(f"Service initialization: {_describe(e)}")
+        print(f"  [ERROR] Service initialization failed: {_describe(e)}", file=out)
+        return errors
+    
+    # Each service is located and constructed on its own, so one failure
+    # does not hide the others
+    services = [
+        ("StreamAnalyzerService", "src.services.stream_analyzer_service",
+         lambda m: m.StreamAnalyzerService(tsduck, telegram)),
+        ("BitrateMonitorService", "src.services.bitrate_monitor_service",
+         lambda m: m.BitrateMonitorService(tsduck, telegram)),
+        ("EPGService", "src.services.epg_service",
+         lambda m: m.EPGService()),
+    ]
+    for name, module_name, create in services:
+        if importlib.util.find_spec(module_name) is None:
+            errors.append(f"{name}: module {module_name} not found")
+            print(f"  [ERROR] {name} module not found", file=out)
+            continue
+        try:
+            create(importlib.import_module(module_name))
+            print(f"  [OK] {name} initialized", file=out)
+        except Exception as e:
+            errors.append(f"{name}: {_describe(e)}")
+            print(f"  [ERROR] {name} initialization failed: {_describe(e)}", file=out)
     
     return errors
 
-def check_widgets():
+def check_widgets(out=None):
     """Check widget initialization"""
-    print("\n[CHECK] Checking widget initialization...")
+    out = out or sys.stdout
+    print("\n[CHECK] Checking widget initialization...", file=out)
     errors = []
     
-    try:
-        from src.services.stream_analyzer_service import StreamAnalyzerService
-        from src.services.bitrate_monitor_service import BitrateMonitorService
-        from src.services.epg_service import EPGService
-        
-        from src.ui.widgets.stream_quality_widget import StreamQualityWidget
-        from src.ui.widgets.bitrate_monitor_widget import BitrateMonitorWidget
-        from src.ui.widgets.epg_editor_widget import EPGEditorWidget
-        
-        # Mock services
-        analyzer = StreamAnalyzerService()
-        monitor = BitrateMonitorService()
-        epg = EPGService()
-        
-        # Try to create widgets (without Qt app, this might fail, but we can check imports)
-        print("  [OK] Widget classes accessible")
-        
-    except Exception as e:
-        errors.append(f"Widget check: {e}")
-        print(f"  [ERROR] Widget check failed: {e}")
-        import traceback
-        traceback.print_exc()
+    # Only module existence is checked here; find_spec locates the widget
+    # modules without executing them (and without importing Qt), and the
+    # classes themselves are already imported by check_imports
+    for module_name in (
+        "src.ui.widgets.stream_quality_widget",
+        "src.ui.widgets.bitrate_monitor_widget",
+        "src.ui.widgets.epg_editor_widget",
+    ):
+        if importlib.util.find_spec(module_name) is None:
+            errors.append(f"Widget module missing: {module_name}")
+            print(f"  [ERROR] Widget module missing: {module_name}", file=out)
+        else:
+            print(f"  [OK] {module_name.rsplit('.', 1)[-1]} found", file=out)
     
     return errors
 
-def check_main_integration():
+# Patterns checked in main_enterprise.py and src/ui/main_window.py, kept as
+# bytes so they can be matched against the memory-mapped files directly
+_MAIN_CHECKS = (
+    (b"StreamAnalyzerService", "StreamAnalyzerService imported"),
+    (b"BitrateMonitorService", "BitrateMonitorService imported"),
+    (b"EPGService", "EPGService imported"),
+    # Services are registered lazily from the SERVICE_SPECS table
+    (b"app_framework.register_lazy_service(", "lazy services registered"),
+    (b"\"stream_analyzer\": (", "stream_analyzer registered"),
+    (b"\"bitrate_monitor\": (", "bitrate_monitor registered"),
+    (b"\"epg\": (", "epg registered"),
+)
+
+_WINDOW_CHECKS = (
+    (b"get_service(\"stream_analyzer\")", "stream_analyzer accessed in UI"),
+    (b"get_service(\"bitrate_monitor\")", "bitrate_monitor accessed in UI"),
+    (b"get_service(\"epg\")", "epg accessed in UI"),
+)
+
+def _compile_checks(checks):
+    """Compile a check table into one regex alternation"""
+    # The lookahead reports a match at every position, so overlapping
+    # patterns cannot hide each other
+    alternation = b"|".join(re.escape(pattern) for pattern, _ in checks)
+    return re.compile(b"(?=(" + alternation + b"))")
+
+_MAIN_REGEX = _compile_checks(_MAIN_CHECKS)
+_WINDOW_REGEX = _compile_checks(_WINDOW_CHECKS)
+
+def _find_patterns(path, regex):
+    """Return the set of byte patterns from a compiled alternation found in a file"""
+    # Scan the memory-mapped bytes directly; no decoding is needed
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return set()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return set(regex.findall(mm))
+
+def _report_checks(checks, found, errors, out):
+    """Print the result of each check and collect the missing ones"""
+    for check, name in checks:
+        if check in found:
+            print(f"  [OK] {name}", file=out)
+        else:
+            errors.append(f"Missing: {name}")
+            print(f"  [ERROR] Missing: {name}", file=out)
+
+def check_main_integration(out=None):
     """Check main_enterprise.py integration"""
-    print("\n[CHECK] Checking main_enterprise.py integration...")
+    out = out or sys.stdout
+    print("\n[CHECK] Checking main_enterprise.py integration...", file=out)
     errors = []
     
     try:
         main_file = Path(__file__).parent / "main_enterprise.py"
-        content = main_file.read_text(encoding='utf-8')
-        
-        checks = [
-            ("StreamAnalyzerService", "StreamAnalyzerService imported"),
-            ("BitrateMonitorService", "BitrateMonitorService imported"),
-            ("EPGService", "EPGService imported"),
-            ("register_service(\"stream_analyzer\"", "stream_analyzer registered"),
-            ("register_service(\"bitrate_monitor\"", "bitrate_monitor registered"),
-            ("register_service(\"epg\"", "epg registered"),
-        ]
         
         # Check main_window.py for service access
         main_window_file = Path(__file__).parent / "src" / "ui" / "main_window.py"
         if main_window_file.exists():
-            main_window_content = main_window_file.read_text(encoding='utf-8')
-            window_checks = [
-                ("get_service(\"stream_analyzer\")", "stream_analyzer accessed in UI"),
-                ("get_service(\"bitrate_monitor\")", "bitrate_monitor accessed in UI"),
-                ("get_service(\"epg\")", "epg accessed in UI"),
-            ]
-            for check, name in window_checks:
-                if check in main_window_content:
-                    print(f"  [OK] {name}")
-                else:
-                    errors.append(f"Missing: {name}")
-                    print(f"  [ERROR] Missing: {name}")
+            found = _find_patterns(main_window_file, _WINDOW_REGEX)
+            _report_checks(_WINDOW_CHECKS, found, errors, out)
         
-        for check, name in checks:
-            if check in content:
-                print(f"  [OK] {name}")
-            else:
-                errors.append(f"Missing: {name}")
-                print(f"  [ERROR] Missing: {name}")
+        found = _find_patterns(main_file, _MAIN_REGEX)
+        _report_checks(_MAIN_CHECKS, found, errors, out)
         
     except Exception as e:
         errors.append(f"Main integration check: {e}")
-        print(f"  [ERROR] Main integration check failed: {e}")
+        print(f"  [ERROR] Main integration check failed: {e}", file=out)
     
     return errors
 
+# Output buffer of the check running on the current thread
+_check_output = threading.local()
+
+class _CheckStderr:
+    """stderr stand-in that writes into the current thread's check buffer
+    
+    Installed while the checks run, so console log handlers created by the
+    services under test (logging.StreamHandler binds sys.stderr when it is
+    constructed) report inside their own check's section.
+    """
+    def write(self, text):
+        out = getattr(_check_output, "out", None)
+        return (out or sys.__stderr__).write(text)
+    
+    def flush(self):
+        pass
+
+def _run_check(check):
+    """Run a check with its output (and log output) captured; returns (errors, output)"""
+    out = io.StringIO()
+    _check_output.out = out
+    try:
+        return check(out), out.getvalue()
+    finally:
+        _check_output.out = None
+
 def main():
     """Run all checks"""
     print("=" * 60)
@@ -153,10 +220,21 @@ def main():
     
     all_errors = []
     
-    all_errors.extend(check_imports())
-    all_errors.extend(check_services())
-    all_errors.extend(check_widgets())
-    all_errors.extend(check_main_integration())
+    # Run the checks concurrently so file I/O overlaps with imports; each
+    # check prints (and logs) into its own buffer, flushed in order to keep
+    # output intact
+    checks = (check_imports, check_services, check_widgets, check_main_integration)
+    stderr = sys.stderr
+    sys.stderr = _CheckStderr()
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [executor.submit(_run_check, check) for check in checks]
+            results = [future.result() for future in futures]
+    finally:
+        sys.stderr = stderr
+    for errors, output in results:
+        sys.stdout.write(output)
+        all_errors.extend(errors)
     
     print("\n" + "=" * 60)
     if all_errors:
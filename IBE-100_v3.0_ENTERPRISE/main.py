@@ -6,13 +6,32 @@ Clean, Minimal Implementation
 
 import sys
 import os
+import functools
+import io
+import socket
+import re
+import collections
+import string
 import shutil
-import psutil
+import stat
+import subprocess
+import platform
+import time
+import threading
+import json
+import traceback
+import http.server
+import email.utils
+import urllib.request
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget
+from PyQt6.QtWidgets import QMessageBox, QInputDialog, QTextEdit, QPlainTextEdit, QDialog
 from PyQt6.QtWidgets import QPushButton, QLabel, QLineEdit, QSpinBox, QGroupBox, QScrollArea, QComboBox, QTimeEdit, QCheckBox
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QTime, QThread
-from PyQt6.QtGui import QFont, QPixmap
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QTime, QThread, QSignalBlocker
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool
+from PyQt6.QtGui import QFont, QPixmap, QTextCursor
 
 # Import profile manager
 try:
@@ -21,12 +40,32 @@ except ImportError:
     # Fallback if profile_manager not found
     ProfileManager = None
 
-# Set UTF-8 encoding for Windows console
-os.system('chcp 65001 >nul 2>&1')
+# Release tags are compared with packaging when it is installed
+try:
+    from packaging.version import Version, InvalidVersion
+except ImportError:
+    Version = None
+
+# Characters not allowed in file system names
+_SAFE_NAME_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+# Set UTF-8 encoding for Windows console (without spawning cmd.exe for chcp)
+if sys.platform == "win32":
+    try:
+        import ctypes
+        ctypes.windll.kernel32.SetConsoleOutputCP(65001)
+    except Exception:
+        pass
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.reconfigure(encoding='utf-8', errors='replace')
+        except Exception:
+            pass
 
 # Find TSDuck installation
+@functools.lru_cache(maxsize=1)
 def find_tsduck():
-    """Find TSDuck installation"""
+    """Find TSDuck installation (cached after the first probe)"""
     # Check common installation paths
     paths = [
         "C:\\Program Files\\TSDuck\\bin\\tsp.exe",
@@ -35,14 +74,16 @@ def find_tsduck():
         "tsp"  # Try PATH without extension
     ]
     
+    # One probe per candidate: absolute paths are stat'ed, bare names
+    # are looked up on PATH
     for path in paths:
-        if shutil.which(path) or os.path.exists(path):
+        if os.path.isabs(path):
             if os.path.exists(path):
                 return path
-            else:
-                found = shutil.which(path)
-                if found:
-                    return found
+        else:
+            found = shutil.which(path)
+            if found:
+                return found
     
     return "tsp"  # Fallback to tsp if not found
 
@@ -51,49 +92,232 @@ print(f"[INFO] TSDuck found at: {TSDUCK_PATH}")
 
 def kill_all_tsduck_processes():
     """Force kill all TSDuck processes running in background"""
-    import subprocess
-    import platform
-    
     killed_count = 0
     
     try:
         if platform.system() == "Windows":
             # Kill tsp.exe processes
-            result = subprocess.run(
-                ["taskkill", "/F", "/IM", "tsp.exe"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-            )
+            try:
+                result = subprocess.run(
+                    ["taskkill", "/F", "/IM", "tsp.exe"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    timeout=3,
+                    creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+                )
+                # Exit code 128 means no tsp.exe is running, which is the
+                # common case; only other failures (e.g. access denied) need
+                # the PowerShell fallback
+                taskkill_ok = result.returncode in (0, 128) or "SUCCESS" in result.stdout
+            except subprocess.TimeoutExpired:
+                result = None
+                taskkill_ok = False
             
             # Count processes killed
-            if "SUCCESS" in result.stdout or "terminated" in result.stdout.lower():
+            if result and ("SUCCESS" in result.stdout or "terminated" in result.stdout.lower()):
                 # Parse output to count
                 lines = result.stdout.split('\n')
                 for line in lines:
                     if "terminated" in line.lower():
                         killed_count += 1
             
-            # Also try PowerShell method as backup
-            try:
-                ps_result = subprocess.run(
-                    ["powershell", "-Command", "Get-Process | Where-Object {$_.ProcessName -like '*tsp*'} | Stop-Process -Force"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    timeout=5,
-                    creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-                )
-            except:
-                pass
+            # PowerShell is slow to start, so only use it as a backup when
+            # taskkill timed out or failed
+            if not taskkill_ok:
+                try:
+                    subprocess.run(
+                        ["powershell", "-Command", "Get-Process | Where-Object {$_.ProcessName -like '*tsp*'} | Stop-Process -Force"],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        timeout=5,
+                        creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+                    )
+                except:
+                    pass
         
         return killed_count
     except Exception as e:
         print(f"[WARNING] Error killing TSDuck processes: {e}")
         return 0
 
+# Latest system metrics samples as (timestamp, value)
+_system_metrics_cache = (0.0, None)
+_disk_usage_cache = (0.0, None)
+
+# Disk fill changes slowly, so it is sampled less often than CPU/memory
+DISK_USAGE_TTL = 5.0
+
+# SCTE-35 status polling stays off until update_scte35_status is fixed
+SCTE35_MONITOR_ENABLED = False
+
+def get_system_metrics(ttl=0.5):
+    """Return (cpu_percent, virtual_memory, disk_usage), reusing a sample younger than ttl seconds"""
+    global _system_metrics_cache, _disk_usage_cache
+    now = time.monotonic()
+    sampled_at, metrics = _system_metrics_cache
+    if metrics is None or now - sampled_at >= ttl:
+        # psutil is only needed once the monitoring tab starts polling
+        import psutil
+        
+        disk_sampled_at, disk = _disk_usage_cache
+        if disk is None or now - disk_sampled_at >= DISK_USAGE_TTL:
+            disk = psutil.disk_usage('/')
+            _disk_usage_cache = (now, disk)
+        
+        # interval=None measures CPU since the previous call instead of
+        # blocking the UI thread for a fresh sampling interval
+        metrics = (
+            psutil.cpu_percent(interval=None),
+            psutil.virtual_memory(),
+            disk,
+        )
+        _system_metrics_cache = (now, metrics)
+    return metrics
+
+# Combo box entries
+INPUT_TYPES = (
+    "HLS (HTTP Live Streaming)", "SRT (Secure Reliable Transport)",
+    "UDP (User Datagram Protocol)", "TCP (Transmission Control Protocol)",
+    "HTTP/HTTPS", "DVB", "ASI",
+)
+OUTPUT_TYPES = ("SRT", "HLS", "DASH", "UDP", "TCP", "HTTP/HTTPS", "File")
+# TSDuck input plugin per input type
+INPUT_PLUGIN_MAP = {
+    "HLS (HTTP Live Streaming)": "hls",
+    "SRT (Secure Reliable Transport)": "srt",
+    "UDP (User Datagram Protocol)": "ip",
+    "TCP (Transmission Control Protocol)": "tcp",
+    "HTTP/HTTPS": "http",
+    "DVB": "dvb",
+    "ASI": "asi",
+}
+CUE_TYPES = (
+    "Pre-roll (Program Transition)", "CUE-OUT (Ad Break Start)",
+    "CUE-IN (Ad Break End)", "Time Signal",
+)
+INPUT_TYPE_INDEX = {text: i for i, text in enumerate(INPUT_TYPES)}
+OUTPUT_TYPE_INDEX = {text: i for i, text in enumerate(OUTPUT_TYPES)}
+
+# Spin box rows: (label, attribute, minimum, maximum, default, suffix, stretch)
+SERVICE_SPINBOX_ROWS = (
+    ("Service ID:", "service_id", 1, 65535, 1, None, False),
+    ("Video PID:", "vpid", 32, 8190, 256, None, False),
+    ("Audio PID:", "apid", 32, 8190, 257, None, False),
+    ("SCTE-35 PID:", "scte35_pid", 32, 8190, 500, None, False),
+)
+
+SRT_SPINBOX_ROWS = (
+    ("Latency (ms):", "latency", 100, 10000, 2000, " ms", False),
+)
+
+HLS_DASH_SPINBOX_ROWS = (
+    ("Segment Duration (seconds):", "segment_duration", 2, 30, 6, " seconds", True),
+    ("Playlist Window Size (segments):", "playlist_window", 3, 20, 5, None, True),
+)
+
+INJECTION_SPINBOX_ROWS = (
+    ("Start Delay (ms):", "start_delay", 0, 10000, 2000, " ms", False),
+    ("Inject Count:", "inject_count", 1, 1000, 1, None, False),
+    ("Inject Interval (ms):", "inject_interval", 100, 60000, 1000, " ms", False),
+)
+
+MARKER_SPINBOX_ROWS = (
+    ("Pre-roll Duration (seconds):", "preroll_duration", 0, 10, 2, None, True),
+    ("Ad Duration (seconds):", "ad_duration", 1, 3600, 600, None, True),
+    ("Event ID:", "event_id", 10000, 99999, 10023, None, True),
+)
+
+def _add_spinbox_row(owner, layout, label, attr, minimum, maximum, value, suffix=None, stretch=False):
+    """Add a labelled QSpinBox row to layout and store it as owner.<attr>"""
+    row = QHBoxLayout()
+    row.addWidget(QLabel(label))
+    if stretch:
+        row.addStretch()
+    spinbox = QSpinBox()
+    spinbox.setRange(minimum, maximum)
+    spinbox.setValue(value)
+    if suffix:
+        spinbox.setSuffix(suffix)
+    row.addWidget(spinbox)
+    layout.addLayout(row)
+    setattr(owner, attr, spinbox)
+    return spinbox
+
+# Profile config fields, in saved order, and how each widget kind is read/written
+CONFIG_FIELDS = (
+    ("input_type", "combo"),
+    ("input_url", "line"),
+    ("output_type", "combo"),
+    ("output_srt", "line"),
+    ("output_hls", "line"),
+    ("output_dash", "line"),
+    ("enable_cors", "check"),
+    ("segment_duration", "spin"),
+    ("playlist_window", "spin"),
+    ("service_name", "line"),
+    ("provider_name", "line"),
+    ("service_id", "spin"),
+    ("vpid", "spin"),
+    ("apid", "spin"),
+    ("scte35_pid", "spin"),
+    ("stream_id", "line"),
+    ("latency", "spin"),
+    ("start_delay", "spin"),
+    ("inject_count", "spin"),
+    ("inject_interval", "spin"),
+)
+
+CONFIG_GETTERS = {"combo": "currentText", "line": "text", "spin": "value", "check": "isChecked"}
+CONFIG_SETTERS = {"line": "setText", "spin": "setValue", "check": "setChecked"}
+CONFIG_CHANGE_SIGNALS = {"combo": "currentTextChanged", "line": "textChanged", "spin": "valueChanged", "check": "toggled"}
+
+def _with_slots(cls):
+    """Rebuild a dataclass with __slots__ for its fields (no instance __dict__)
+    
+    Equivalent to dataclass(slots=True), which needs Python 3.10. Field
+    defaults live in the generated __init__, so the class attributes holding
+    them can be replaced by slot descriptors.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = {
+        key: value for key, value in cls.__dict__.items()
+        if key not in field_names and key not in ('__dict__', '__weakref__')
+    }
+    namespace['__slots__'] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+# Stream settings in CONFIG_FIELDS order, defaults as used by build_command
+@_with_slots
+@dataclass(frozen=True)
+class StreamConfig:
+    """Stream settings read from StreamConfigWidget, as used by build_command"""
+    input_type: str = "HLS (HTTP Live Streaming)"
+    input_url: str = "https://cdn.example.com/stream/index.m3u8"
+    output_type: str = "SRT"
+    output_srt: str = "cdn.example.com:8888"
+    output_hls: str = "output/hls"
+    output_dash: str = "output/dash"
+    enable_cors: bool = True
+    segment_duration: int = 6
+    playlist_window: int = 5
+    service_name: str = "SCTE-35 Stream"
+    provider_name: str = "ITAssist"
+    service_id: int = 1
+    vpid: int = 256
+    apid: int = 257
+    scte35_pid: int = 500
+    stream_id: str = "#!::r=scte/scte,m=publish"
+    latency: int = 2000
+    start_delay: int = 2000
+    inject_count: int = 1
+    inject_interval: int = 1000
+
+
 class StreamConfigWidget(QWidget):
     """Stream Configuration - Input/Output Settings"""
+    config_changed = pyqtSignal()  # any config field was edited
     
     def __init__(self):
         super().__init__()
@@ -102,7 +326,30 @@ class StreamConfigWidget(QWidget):
             self.profile_manager = ProfileManager()
         else:
             self.profile_manager = None
-        self.setup_ui()
+        self._profile_names_cache = None
+        self._last_output_type = None
+        # Field values as of the last edit (see get_config/get_stream_config)
+        self._config_cache = None
+        self._stream_config = None
+        # The widget tree is built on first show (or first config access)
+        self._ui_built = False
+    
+    def _ensure_ui(self):
+        """Build the UI once"""
+        if not self._ui_built:
+            self._ui_built = True
+            self.setup_ui()
+            for key, kind in CONFIG_FIELDS:
+                getattr(getattr(self, key), CONFIG_CHANGE_SIGNALS[kind]).connect(self._emit_config_changed)
+    
+    def _emit_config_changed(self, *args):
+        self._config_cache = None
+        self._stream_config = None
+        self.config_changed.emit()
+    
+    def showEvent(self, event):
+        self._ensure_ui()
+        super().showEvent(event)
     
     def setup_ui(self):
         scroll = QScrollArea()
@@ -113,7 +360,7 @@ class StreamConfigWidget(QWidget):
         # Profile Management Section
         if self.profile_manager:
             profile_group = QGroupBox("Profile Management")
-            profile_layout = QVBoxLayout()
+            profile_layout = QVBoxLayout(profile_group)
             
             # Profile Selection
             profile_select_layout = QHBoxLayout()
@@ -141,19 +388,19 @@ class StreamConfigWidget(QWidget):
             profile_select_layout.addWidget(self.delete_profile_btn)
             
             profile_layout.addLayout(profile_select_layout)
-            profile_group.setLayout(profile_layout)
             layout.addWidget(profile_group)
         
         # Input Configuration
         input_group = QGroupBox("Input Stream")
-        input_layout = QVBoxLayout()
+        input_layout = QVBoxLayout(input_group)
         
         # Input Type Selection
         input_type_layout = QHBoxLayout()
         input_type_layout.addWidget(QLabel("Input Type:"))
         self.input_type = QComboBox()
-        self.input_type.addItems(["HLS (HTTP Live Streaming)", "SRT (Secure Reliable Transport)", "UDP (User Datagram Protocol)", "TCP (Transmission Control Protocol)", "HTTP/HTTPS", "DVB", "ASI"])
+        self.input_type.addItems(INPUT_TYPES)
         self.input_type.setCurrentText("HLS (HTTP Live Streaming)")
+        self._input_type_index = INPUT_TYPE_INDEX
         input_type_layout.addWidget(self.input_type)
         input_layout.addLayout(input_type_layout)
         
@@ -164,20 +411,20 @@ class StreamConfigWidget(QWidget):
         input_layout.addWidget(QLabel("Stream URL/Address:"))
         input_layout.addWidget(self.input_url)
         
-        input_group.setLayout(input_layout)
         layout.addWidget(input_group)
         
         # Output Configuration
         output_group = QGroupBox("Output Streams")
-        output_layout = QVBoxLayout()
+        output_layout = QVBoxLayout(output_group)
         
         # Output Type Selection
         output_type_layout = QHBoxLayout()
         output_type_layout.addWidget(QLabel("Output Type:"))
         output_type_layout.addStretch()
         self.output_type = QComboBox()
-        self.output_type.addItems(["SRT", "HLS", "DASH", "UDP", "TCP", "HTTP/HTTPS", "File"])
+        self.output_type.addItems(OUTPUT_TYPES)
         self.output_type.setCurrentText("SRT")
+        self._output_type_index = OUTPUT_TYPE_INDEX
         output_type_layout.addWidget(self.output_type)
         output_layout.addLayout(output_type_layout)
         
@@ -212,12 +459,11 @@ class StreamConfigWidget(QWidget):
         # Show/Hide based on output type
         self.output_type.currentTextChanged.connect(self.on_output_type_changed)
         
-        output_group.setLayout(output_layout)
         layout.addWidget(output_group)
         
         # Service Configuration
         service_group = QGroupBox("Service Configuration")
-        service_layout = QVBoxLayout()
+        service_layout = QVBoxLayout(service_group)
         
         # Service Name
         service_name_layout = QHBoxLayout()
@@ -235,48 +481,14 @@ class StreamConfigWidget(QWidget):
         provider_layout.addWidget(self.provider_name)
         service_layout.addLayout(provider_layout)
         
-        # Service ID
-        service_id_layout = QHBoxLayout()
-        service_id_layout.addWidget(QLabel("Service ID:"))
-        self.service_id = QSpinBox()
-        self.service_id.setRange(1, 65535)
-        self.service_id.setValue(1)
-        service_id_layout.addWidget(self.service_id)
-        service_layout.addLayout(service_id_layout)
-        
-        # Video PID
-        vpid_layout = QHBoxLayout()
-        vpid_layout.addWidget(QLabel("Video PID:"))
-        self.vpid = QSpinBox()
-        self.vpid.setRange(32, 8190)
-        self.vpid.setValue(256)
-        vpid_layout.addWidget(self.vpid)
-        service_layout.addLayout(vpid_layout)
-        
-        # Audio PID
-        apid_layout = QHBoxLayout()
-        apid_layout.addWidget(QLabel("Audio PID:"))
-        self.apid = QSpinBox()
-        self.apid.setRange(32, 8190)
-        self.apid.setValue(257)
-        apid_layout.addWidget(self.apid)
-        service_layout.addLayout(apid_layout)
-        
-        # SCTE-35 PID
-        scte35_pid_layout = QHBoxLayout()
-        scte35_pid_layout.addWidget(QLabel("SCTE-35 PID:"))
-        self.scte35_pid = QSpinBox()
-        self.scte35_pid.setRange(32, 8190)
-        self.scte35_pid.setValue(500)
-        scte35_pid_layout.addWidget(self.scte35_pid)
-        service_layout.addLayout(scte35_pid_layout)
-        
-        service_group.setLayout(service_layout)
+        for row in SERVICE_SPINBOX_ROWS:
+            _add_spinbox_row(self, service_layout, *row)
+        
         layout.addWidget(service_group)
         
         # SRT Configuration
         srt_group = QGroupBox("SRT Configuration")
-        srt_layout = QVBoxLayout()
+        srt_layout = QVBoxLayout(srt_group)
         
         # Stream ID
         streamid_layout = QHBoxLayout()
@@ -287,22 +499,14 @@ class StreamConfigWidget(QWidget):
         streamid_layout.addWidget(self.stream_id)
         srt_layout.addLayout(streamid_layout)
         
-        # Latency
-        latency_layout = QHBoxLayout()
-        latency_layout.addWidget(QLabel("Latency (ms):"))
-        self.latency = QSpinBox()
-        self.latency.setRange(100, 10000)
-        self.latency.setValue(2000)
-        self.latency.setSuffix(" ms")
-        latency_layout.addWidget(self.latency)
-        srt_layout.addLayout(latency_layout)
-        
-        srt_group.setLayout(srt_layout)
+        for row in SRT_SPINBOX_ROWS:
+            _add_spinbox_row(self, srt_layout, *row)
+        
         layout.addWidget(srt_group)
         
         # HLS/DASH Output Settings
         hls_dash_group = QGroupBox("HLS/DASH Output Settings (For Local Server)")
-        hls_dash_layout = QVBoxLayout()
+        hls_dash_layout = QVBoxLayout(hls_dash_group)
         
         # CORS Enable
         cors_layout = QHBoxLayout()
@@ -311,64 +515,18 @@ class StreamConfigWidget(QWidget):
         cors_layout.addWidget(self.enable_cors)
         hls_dash_layout.addLayout(cors_layout)
         
-        # Segment Duration
-        segment_duration_layout = QHBoxLayout()
-        segment_duration_layout.addWidget(QLabel("Segment Duration (seconds):"))
-        segment_duration_layout.addStretch()
-        self.segment_duration = QSpinBox()
-        self.segment_duration.setRange(2, 30)
-        self.segment_duration.setValue(6)
-        self.segment_duration.setSuffix(" seconds")
-        segment_duration_layout.addWidget(self.segment_duration)
-        hls_dash_layout.addLayout(segment_duration_layout)
-        
-        # Playlist Window Size
-        playlist_window_layout = QHBoxLayout()
-        playlist_window_layout.addWidget(QLabel("Playlist Window Size (segments):"))
-        playlist_window_layout.addStretch()
-        self.playlist_window = QSpinBox()
-        self.playlist_window.setRange(3, 20)
-        self.playlist_window.setValue(5)
-        playlist_window_layout.addWidget(self.playlist_window)
-        hls_dash_layout.addLayout(playlist_window_layout)
-        
-        hls_dash_group.setLayout(hls_dash_layout)
+        for row in HLS_DASH_SPINBOX_ROWS:
+            _add_spinbox_row(self, hls_dash_layout, *row)
+        
         layout.addWidget(hls_dash_group)
         
         # SCTE-35 Injection Settings
         injection_group = QGroupBox("SCTE-35 Injection Settings")
-        injection_layout = QVBoxLayout()
-        
-        # Start Delay
-        start_delay_layout = QHBoxLayout()
-        start_delay_layout.addWidget(QLabel("Start Delay (ms):"))
-        self.start_delay = QSpinBox()
-        self.start_delay.setRange(0, 10000)
-        self.start_delay.setValue(2000)
-        self.start_delay.setSuffix(" ms")
-        start_delay_layout.addWidget(self.start_delay)
-        injection_layout.addLayout(start_delay_layout)
-        
-        # Inject Count
-        inject_count_layout = QHBoxLayout()
-        inject_count_layout.addWidget(QLabel("Inject Count:"))
-        self.inject_count = QSpinBox()
-        self.inject_count.setRange(1, 1000)
-        self.inject_count.setValue(1)
-        inject_count_layout.addWidget(self.inject_count)
-        injection_layout.addLayout(inject_count_layout)
-        
-        # Inject Interval
-        inject_interval_layout = QHBoxLayout()
-        inject_interval_layout.addWidget(QLabel("Inject Interval (ms):"))
-        self.inject_interval = QSpinBox()
-        self.inject_interval.setRange(100, 60000)
-        self.inject_interval.setValue(1000)
-        self.inject_interval.setSuffix(" ms")
-        inject_interval_layout.addWidget(self.inject_interval)
-        injection_layout.addLayout(inject_interval_layout)
-        
-        injection_group.setLayout(injection_layout)
+        injection_layout = QVBoxLayout(injection_group)
+        
+        for row in INJECTION_SPINBOX_ROWS:
+            _add_spinbox_row(self, injection_layout, *row)
+        
         layout.addWidget(injection_group)
         
         layout.addStretch()
@@ -380,6 +538,11 @@ class StreamConfigWidget(QWidget):
     
     def on_output_type_changed(self, text):
         """Show/hide output fields based on selected output type"""
+        # Nothing to do if this type's fields are already shown
+        if text == self._last_output_type:
+            return
+        self._last_output_type = text
+        
         # Hide all output fields and labels
         self.output_srt.setVisible(False)
         self.output_hls.setVisible(False)
@@ -406,16 +569,41 @@ class StreamConfigWidget(QWidget):
             else:
                 self.output_srt.setPlaceholderText("Enter SRT destination (e.g., cdn.example.com:8888)")
     
+    def _get_profile_names_cached(self):
+        """Return profile names, reusing the list until profiles change"""
+        if self._profile_names_cache is None:
+            self._profile_names_cache = self.profile_manager.get_profile_names()
+        return self._profile_names_cache
+    
     def refresh_profiles(self):
-        """Refresh profile list in combo box"""
+        """Rebuild the profile list in the combo box (save/delete update it in place)"""
         if not self.profile_manager:
             return
         
+        self._profile_names_cache = None
         self.profile_combo.clear()
-        profiles = self.profile_manager.get_profile_names()
+        profiles = self._get_profile_names_cached()
         if profiles:
             self.profile_combo.addItems(profiles)
     
+    def _insert_profile_name(self, name):
+        """Add a saved profile to the combo box if missing and return its index"""
+        index = self.profile_combo.findText(name)
+        if index < 0:
+            blocker = QSignalBlocker(self.profile_combo)
+            self.profile_combo.addItem(name)
+            blocker.unblock()
+            index = self.profile_combo.count() - 1
+        return index
+    
+    def _remove_profile_name(self, name):
+        """Remove a deleted profile from the combo box"""
+        index = self.profile_combo.findText(name)
+        if index >= 0:
+            blocker = QSignalBlocker(self.profile_combo)
+            self.profile_combo.removeItem(index)
+            blocker.unblock()
+    
     def load_selected_profile(self):
         """Load selected profile configuration"""
         if not self.profile_manager:
@@ -426,8 +614,7 @@ class StreamConfigWidget(QWidget):
             return
         
         # Check if it's an existing profile
-        if profile_name not in self.profile_manager.get_profile_names():
-            from PyQt6.QtWidgets import QMessageBox
+        if profile_name not in self._get_profile_names_cached():
             QMessageBox.warning(
                 self,
                 "Profile Not Found",
@@ -444,127 +631,56 @@ class StreamConfigWidget(QWidget):
     
     def update_output_paths_for_profile(self, profile_name):
         """Update output directories to include profile name"""
-        import re
-        import os
         # Sanitize profile name for file system (remove invalid characters)
-        safe_name = re.sub(r'[<>:"/\\|?*]', '_', profile_name)
-        safe_name = safe_name.strip()
+        safe_name = profile_name.translate(_SAFE_NAME_TRANS).strip()
+        safe_name_folded = safe_name.casefold()
         
-        # Update HLS output path
-        current_hls = self.output_hls.text().strip()
-        # Check if path already contains the profile name (avoid duplication)
-        if safe_name.lower() in current_hls.lower():
-            # Path already contains profile name, keep it
-            pass
-        elif current_hls.startswith("output/"):
-            # Standard output/ path - add profile folder
-            self.output_hls.setText(f"output/{safe_name}/hls")
-        elif current_hls:
-            # Custom path - add profile folder
-            base = current_hls.rstrip("/")
-            # Check if it ends with /hls or /dash and insert profile name before that
-            if current_hls.endswith("/hls"):
-                base = base[:-4]  # Remove /hls
-                self.output_hls.setText(f"{base}/{safe_name}/hls")
-            else:
-                self.output_hls.setText(f"{base}/{safe_name}/hls")
-        else:
-            self.output_hls.setText(f"output/{safe_name}/hls")
+        self._rewrite_output_path(self.output_hls, "hls", safe_name, safe_name_folded)
+        self._rewrite_output_path(self.output_dash, "dash", safe_name, safe_name_folded)
         
-        # Update DASH output path
-        current_dash = self.output_dash.text().strip()
+        print(f"[INFO] Updated output paths for profile: {profile_name} -> {safe_name}")
+    
+    def _rewrite_output_path(self, edit, suffix, safe_name, safe_name_folded):
+        """Insert the profile folder into an HLS/DASH output path"""
+        current = edit.text().strip()
         # Check if path already contains the profile name (avoid duplication)
-        if safe_name.lower() in current_dash.lower():
-            # Path already contains profile name, keep it
-            pass
-        elif current_dash.startswith("output/"):
+        if safe_name_folded in current.casefold():
+            return
+        
+        if not current or current.startswith("output/"):
             # Standard output/ path - add profile folder
-            self.output_dash.setText(f"output/{safe_name}/dash")
-        elif current_dash:
-            # Custom path - add profile folder
-            base = current_dash.rstrip("/")
-            # Check if it ends with /dash and insert profile name before that
-            if current_dash.endswith("/dash"):
-                base = base[:-5]  # Remove /dash
-                self.output_dash.setText(f"{base}/{safe_name}/dash")
-            else:
-                self.output_dash.setText(f"{base}/{safe_name}/dash")
-        else:
-            self.output_dash.setText(f"output/{safe_name}/dash")
+            edit.setText(f"output/{safe_name}/{suffix}")
+            return
         
-        print(f"[INFO] Updated output paths for profile: {profile_name} -> {safe_name}")
+        # Custom path - insert profile folder before a trailing /hls or /dash
+        base = current.rstrip("/")
+        if base.endswith("/" + suffix):
+            base = base[:-(len(suffix) + 1)]
+        edit.setText(f"{base}/{safe_name}/{suffix}")
     
     def apply_config(self, config):
         """Apply configuration dictionary to UI fields"""
-        # Input settings
-        if "input_type" in config:
-            index = self.input_type.findText(config["input_type"])
-            if index >= 0:
-                self.input_type.setCurrentIndex(index)
-        
-        if "input_url" in config:
-            self.input_url.setText(config["input_url"])
-        
-        # Output settings
-        if "output_type" in config:
-            index = self.output_type.findText(config["output_type"])
-            if index >= 0:
-                self.output_type.setCurrentIndex(index)
-        
-        if "output_srt" in config:
-            self.output_srt.setText(config["output_srt"])
-        
-        if "output_hls" in config:
-            self.output_hls.setText(config["output_hls"])
-        
-        if "output_dash" in config:
-            self.output_dash.setText(config["output_dash"])
-        
-        # Service settings
-        if "service_name" in config:
-            self.service_name.setText(config["service_name"])
-        
-        if "provider_name" in config:
-            self.provider_name.setText(config["provider_name"])
-        
-        if "service_id" in config:
-            self.service_id.setValue(config["service_id"])
-        
-        if "vpid" in config:
-            self.vpid.setValue(config["vpid"])
-        
-        if "apid" in config:
-            self.apid.setValue(config["apid"])
-        
-        if "scte35_pid" in config:
-            self.scte35_pid.setValue(config["scte35_pid"])
-        
-        # SRT settings
-        if "stream_id" in config:
-            self.stream_id.setText(config["stream_id"])
-        
-        if "latency" in config:
-            self.latency.setValue(config["latency"])
-        
-        # HLS/DASH settings
-        if "enable_cors" in config:
-            self.enable_cors.setChecked(config["enable_cors"])
-        
-        if "segment_duration" in config:
-            self.segment_duration.setValue(config["segment_duration"])
-        
-        if "playlist_window" in config:
-            self.playlist_window.setValue(config["playlist_window"])
-        
-        # Injection settings
-        if "start_delay" in config:
-            self.start_delay.setValue(config["start_delay"])
-        
-        if "inject_count" in config:
-            self.inject_count.setValue(config["inject_count"])
+        self._ensure_ui()
+        
+        # Block change signals while the fields are filled in, so slots such as
+        # on_output_type_changed run once at the end instead of per field
+        blockers = [QSignalBlocker(getattr(self, key)) for key, _ in CONFIG_FIELDS]
+        
+        for key, kind in CONFIG_FIELDS:
+            if key not in config:
+                continue
+            widget = getattr(self, key)
+            if kind == "combo":
+                # Unknown combo entries are ignored
+                index = getattr(self, f"_{key}_index").get(config[key])
+                if index is not None:
+                    widget.setCurrentIndex(index)
+            else:
+                getattr(widget, CONFIG_SETTERS[kind])(config[key])
         
-        if "inject_interval" in config:
-            self.inject_interval.setValue(config["inject_interval"])
+        for blocker in blockers:
+            blocker.unblock()
+        self._emit_config_changed()
         
         # Trigger output type change to show/hide fields
         self.on_output_type_changed(self.output_type.currentText())
@@ -574,12 +690,13 @@ class StreamConfigWidget(QWidget):
         if not self.profile_manager:
             return
         
-        from PyQt6.QtWidgets import QInputDialog, QMessageBox
+        # One set per save for the membership checks below
+        profile_names = set(self._get_profile_names_cached())
         
         # Get profile name from combo box or dialog
         current_text = self.profile_combo.currentText().strip()
         
-        if current_text and current_text in self.profile_manager.get_profile_names():
+        if current_text and current_text in profile_names:
             # Profile exists, ask for overwrite
             name = current_text
         elif current_text:
@@ -591,7 +708,7 @@ class StreamConfigWidget(QWidget):
                 self,
                 "Save Profile",
                 "Profile Name:",
-                text=f"Profile_{len(self.profile_manager.get_profile_names()) + 1}"
+                text=f"Profile_{len(profile_names) + 1}"
             )
             
             if not ok or not name.strip():
@@ -609,7 +726,7 @@ class StreamConfigWidget(QWidget):
             desc = ""
         
         # Check if profile exists
-        if name in self.profile_manager.get_profile_names():
+        if name in profile_names:
             reply = QMessageBox.question(
                 self,
                 "Profile Exists",
@@ -628,11 +745,9 @@ class StreamConfigWidget(QWidget):
         
         # Save profile
         if self.profile_manager.save_profile(name, config, desc):
-            self.refresh_profiles()
+            self._profile_names_cache = None
             # Select the saved profile
-            index = self.profile_combo.findText(name)
-            if index >= 0:
-                self.profile_combo.setCurrentIndex(index)
+            self.profile_combo.setCurrentIndex(self._insert_profile_name(name))
             QMessageBox.information(self, "Success", f"Profile '{name}' saved successfully!")
         else:
             QMessageBox.warning(self, "Error", "Failed to save profile!")
@@ -646,8 +761,6 @@ class StreamConfigWidget(QWidget):
         if not profile_name:
             return
         
-        from PyQt6.QtWidgets import QMessageBox
-        
         reply = QMessageBox.question(
             self,
             "Delete Profile",
@@ -657,44 +770,160 @@ class StreamConfigWidget(QWidget):
         
         if reply == QMessageBox.StandardButton.Yes:
             if self.profile_manager.delete_profile(profile_name):
-                self.refresh_profiles()
+                self._profile_names_cache = None
+                self._remove_profile_name(profile_name)
                 QMessageBox.information(self, "Success", f"Profile '{profile_name}' deleted!")
             else:
                 QMessageBox.warning(self, "Error", "Failed to delete profile!")
     
     def get_config(self):
-        return {
-            "input_type": self.input_type.currentText(),
-            "input_url": self.input_url.text(),
-            "output_type": self.output_type.currentText(),
-            "output_srt": self.output_srt.text(),
-            "output_hls": self.output_hls.text(),
-            "output_dash": self.output_dash.text(),
-            "enable_cors": self.enable_cors.isChecked(),
-            "segment_duration": self.segment_duration.value(),
-            "playlist_window": self.playlist_window.value(),
-            "service_name": self.service_name.text(),
-            "provider_name": self.provider_name.text(),
-            "service_id": self.service_id.value(),
-            "vpid": self.vpid.value(),
-            "apid": self.apid.value(),
-            "scte35_pid": self.scte35_pid.value(),
-            "stream_id": self.stream_id.text(),
-            "latency": self.latency.value(),
-            "start_delay": self.start_delay.value(),
-            "inject_count": self.inject_count.value(),
-            "inject_interval": self.inject_interval.value()
-        }
+        self._ensure_ui()
+        # Fields are only re-read after an edit; callers get their own copy
+        if self._config_cache is None:
+            self._config_cache = {key: getattr(getattr(self, key), CONFIG_GETTERS[kind])() for key, kind in CONFIG_FIELDS}
+        return dict(self._config_cache)
+    
+    def get_stream_config(self):
+        """Return the current config as a (shared, immutable) StreamConfig"""
+        if self._stream_config is None:
+            self._stream_config = StreamConfig(**self.get_config())
+        return self._stream_config
+
+
+# SCTE-35 marker XML per cue prefix; only the $-fields change between markers
+SCTE35_XML_TEMPLATES = {
+    "preroll": string.Template('''<?xml version="1.0" encoding="UTF-8"?>
+<tsduck>
+    <splice_information_table protocol_version="0" pts_adjustment="0" tier="0xFFF">
+        <splice_insert splice_event_id="$event_id" 
+                      splice_event_cancel="false" 
+                      out_of_network="true" 
+                      splice_immediate="false" 
+                      pts_time="$pts" 
+                      unique_program_id="1" 
+                      avail_num="1" 
+                      avails_expected="1">
+            <break_duration auto_return="true" duration="$duration" />
+        </splice_insert>
+    </splice_information_table>
+</tsduck>'''),
+    "cue_out": string.Template('''<?xml version="1.0" encoding="UTF-8"?>
+<tsduck>
+    <splice_information_table protocol_version="0" pts_adjustment="0" tier="0xFFF">
+        <splice_insert splice_event_id="$event_id" 
+                      splice_event_cancel="false" 
+                      out_of_network="true" 
+                      splice_immediate="false" 
+                      pts_time="0" 
+                      unique_program_id="1" 
+                      avail_num="1" 
+                      avails_expected="1">
+            <break_duration auto_return="false" duration="$duration" />
+        </splice_insert>
+    </splice_information_table>
+</tsduck>'''),
+    "cue_in": string.Template('''<?xml version="1.0" encoding="UTF-8"?>
+<tsduck>
+    <splice_information_table protocol_version="0" pts_adjustment="0" tier="0xFFF">
+        <splice_insert splice_event_id="$event_id" 
+                      splice_event_cancel="false" 
+                      out_of_network="false" 
+                      splice_immediate="true" 
+                      pts_time="0" 
+                      unique_program_id="1" 
+                      avail_num="1" 
+                      avails_expected="1">
+            <break_duration auto_return="true" duration="0" />
+        </splice_insert>
+    </splice_information_table>
+</tsduck>'''),
+    "time_signal": string.Template('''<?xml version="1.0" encoding="UTF-8"?>
+<tsduck>
+    <splice_information_table protocol_version="0" pts_adjustment="0" tier="0xFFF">
+        <splice_time_signal splice_event_id="$event_id" 
+                           splice_event_cancel="false">
+            <splice_time pts_time="0" />
+        </splice_time_signal>
+    </splice_information_table>
+</tsduck>'''),
+}
+
+# Marker metadata, laid out as json.dumps(..., indent=2) would; string and
+# boolean fields are substituted already JSON-encoded
+SCTE35_JSON_TEMPLATE = string.Template('''{
+  "scte35_marker": {
+    "event_id": $event_id,
+    "cue_type": $cue_type,
+    "preroll_seconds": $preroll,
+    "ad_duration_seconds": $ad_duration,
+    "schedule_time": $schedule_time,
+    "immediate": $immediate,
+    "created_at": $created_at
+  }
+}''')
+
+class MarkerWriteSignals(QObject):
+    """Signals emitted by MarkerWriteTask"""
+    written = pyqtSignal(str, str)  # xml path, json path
+    failed = pyqtSignal(str)  # error message
+
+
+class MarkerWriteTask(QRunnable):
+    """Write a marker's XML and JSON files on the thread pool"""
+    
+    def __init__(self, xml_path, xml_content, json_path, json_content):
+        super().__init__()
+        self.xml_path = xml_path
+        self.xml_content = xml_content
+        self.json_path = json_path
+        self.json_content = json_content
+        self.signals = MarkerWriteSignals()
+    
+    @staticmethod
+    def _write_bytes(path, data):
+        # Written under a temporary name and renamed, so a directory scan
+        # (get_latest_marker) never sees a partially written marker
+        tmp_path = f"{path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    
+    def run(self):
+        try:
+            # JSON first: the XML file is what marks a marker as available
+            self._write_bytes(self.json_path, self.json_content.encode('utf-8'))
+            self._write_bytes(self.xml_path, self.xml_content.encode('utf-8'))
+            self.signals.written.emit(str(self.xml_path), str(self.json_path))
+        except Exception as e:
+            self.signals.failed.emit(str(e))
 
 
 class SCTE35Widget(QWidget):
     """SCTE-35 Marker Generation Tool"""
     
-    marker_generated = pyqtSignal(str, str)  # Emits XML file path
+    marker_generated = pyqtSignal(str, str)  # XML file path, JSON file path (both written)
+    
+    # Marker file prefix per cue type, in CUE_TYPES (combo box) order
+    CUE_PREFIXES = ("preroll", "cue_out", "cue_in", "time_signal")
     
     def __init__(self):
         super().__init__()
-        self.setup_ui()
+        # Create scte35_final directory once; markers are written there
+        self._markers_dir = Path("scte35_final")
+        self._markers_dir.mkdir(exist_ok=True)
+        # Signal objects of marker writes still in flight (kept alive until done)
+        self._pending_writes = set()
+        # The widget tree is built when the tab is first shown
+        self._ui_built = False
+    
+    def showEvent(self, event):
+        if not self._ui_built:
+            self._ui_built = True
+            self.setup_ui()
+        super().showEvent(event)
     
     def setup_ui(self):
         scroll = QScrollArea()
@@ -709,54 +938,23 @@ class SCTE35Widget(QWidget):
         
         # Configuration Group
         config_group = QGroupBox("Marker Configuration")
-        config_layout = QVBoxLayout()
-        
-        # Pre-roll Duration
-        preroll_layout = QHBoxLayout()
-        preroll_layout.addWidget(QLabel("Pre-roll Duration (seconds):"))
-        preroll_layout.addStretch()
-        self.preroll_duration = QSpinBox()
-        self.preroll_duration.setRange(0, 10)
-        self.preroll_duration.setValue(2)
-        self.preroll_duration.setMinimumWidth(150)
-        preroll_layout.addWidget(self.preroll_duration)
-        config_layout.addLayout(preroll_layout)
-        
-        # Ad Duration
-        ad_duration_layout = QHBoxLayout()
-        ad_duration_layout.addWidget(QLabel("Ad Duration (seconds):"))
-        ad_duration_layout.addStretch()
-        self.ad_duration = QSpinBox()
-        self.ad_duration.setRange(1, 3600)
-        self.ad_duration.setValue(600)
-        self.ad_duration.setMinimumWidth(150)
-        ad_duration_layout.addWidget(self.ad_duration)
-        config_layout.addLayout(ad_duration_layout)
-        
-        # Event ID
-        event_id_layout = QHBoxLayout()
-        event_id_layout.addWidget(QLabel("Event ID:"))
-        event_id_layout.addStretch()
-        self.event_id = QSpinBox()
-        self.event_id.setRange(10000, 99999)
-        self.event_id.setValue(10023)
-        self.event_id.setMinimumWidth(150)
-        event_id_layout.addWidget(self.event_id)
-        config_layout.addLayout(event_id_layout)
-        
-        config_group.setLayout(config_layout)
+        config_layout = QVBoxLayout(config_group)
+        
+        for row in MARKER_SPINBOX_ROWS:
+            _add_spinbox_row(self, config_layout, *row).setMinimumWidth(150)
+        
         layout.addWidget(config_group)
         
         # Manual Cue Options
         cue_group = QGroupBox("Manual Cue Options")
-        cue_layout = QVBoxLayout()
+        cue_layout = QVBoxLayout(cue_group)
         
         # Cue Type
         cue_type_layout = QHBoxLayout()
         cue_type_layout.addWidget(QLabel("Cue Type:"))
         cue_type_layout.addStretch()
         self.cue_type = QComboBox()
-        self.cue_type.addItems(["Pre-roll (Program Transition)", "CUE-OUT (Ad Break Start)", "CUE-IN (Ad Break End)", "Time Signal"])
+        self.cue_type.addItems(CUE_TYPES)
         self.cue_type.setCurrentText("Pre-roll (Program Transition)")
         cue_type_layout.addWidget(self.cue_type)
         cue_layout.addLayout(cue_type_layout)
@@ -765,8 +963,6 @@ class SCTE35Widget(QWidget):
         schedule_layout = QHBoxLayout()
         schedule_layout.addWidget(QLabel("Schedule Time (HH:MM:SS):"))
         schedule_layout.addStretch()
-        from PyQt6.QtWidgets import QTimeEdit
-        from PyQt6.QtCore import QTime
         self.schedule_time = QTimeEdit()
         self.schedule_time.setDisplayFormat("HH:mm:ss")
         self.schedule_time.setTime(QTime.currentTime())
@@ -775,12 +971,10 @@ class SCTE35Widget(QWidget):
         cue_layout.addLayout(schedule_layout)
         
         # Enable immediate cue
-        from PyQt6.QtWidgets import QCheckBox
         self.immediate_cue = QCheckBox("Trigger Cue Immediately (No Schedule)")
         self.immediate_cue.setChecked(True)
         cue_layout.addWidget(self.immediate_cue)
         
-        cue_group.setLayout(cue_layout)
         layout.addWidget(cue_group)
         
         # Generate Button
@@ -809,11 +1003,12 @@ class SCTE35Widget(QWidget):
         self.setLayout(main_layout)
     
     def generate_marker(self):
-        """Generate SCTE-35 marker XML file with manual cue support"""
+        """Generate SCTE-35 marker XML file with manual cue support
+        
+        The files are written on the thread pool; their paths are only
+        published through marker_generated, once both exist on disk.
+        """
         try:
-            from datetime import datetime
-            import json
-            
             # Get parameters
             preroll = self.preroll_duration.value()
             ad_duration = self.ad_duration.value()
@@ -822,19 +1017,11 @@ class SCTE35Widget(QWidget):
             schedule_time = self.schedule_time.time() if not self.immediate_cue.isChecked() else None
             immediate = self.immediate_cue.isChecked()
             
-            # Create scte35_final directory if it doesn't exist
-            markers_dir = Path("scte35_final")
-            markers_dir.mkdir(exist_ok=True)
+            markers_dir = self._markers_dir
             
             # Generate timestamped filename based on cue type
             timestamp = int(datetime.now().timestamp())
-            cue_prefix_map = {
-                "Pre-roll (Program Transition)": "preroll",
-                "CUE-OUT (Ad Break Start)": "cue_out",
-                "CUE-IN (Ad Break End)": "cue_in",
-                "Time Signal": "time_signal"
-            }
-            cue_prefix = cue_prefix_map.get(cue_type, "preroll")
+            cue_prefix = self.CUE_PREFIXES[max(self.cue_type.currentIndex(), 0)]
             xml_filename = f"{cue_prefix}_{event_id}_{timestamp}.xml"
             json_filename = f"{cue_prefix}_{event_id}_{timestamp}.json"
             
@@ -843,93 +1030,150 @@ class SCTE35Widget(QWidget):
             
             # Generate XML marker based on cue type
             # TSDuck requires <tsduck> root with <splice_information_table>
-            if cue_type == "Pre-roll (Program Transition)":
-                xml_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<tsduck>
-    <splice_information_table protocol_version="0" pts_adjustment="0" tier="0xFFF">
-        <splice_insert splice_event_id="{event_id}" 
-                      splice_event_cancel="false" 
-                      out_of_network="true" 
-                      splice_immediate="false" 
-                      pts_time="{preroll * 90000}" 
-                      unique_program_id="1" 
-                      avail_num="1" 
-                      avails_expected="1">
-            <break_duration auto_return="true" duration="{ad_duration * 90000}" />
-        </splice_insert>
-    </splice_information_table>
-</tsduck>'''
-            elif cue_type == "CUE-OUT (Ad Break Start)":
-                xml_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<tsduck>
-    <splice_information_table protocol_version="0" pts_adjustment="0" tier="0xFFF">
-        <splice_insert splice_event_id="{event_id}" 
-                      splice_event_cancel="false" 
-                      out_of_network="true" 
-                      splice_immediate="false" 
-                      pts_time="0" 
-                      unique_program_id="1" 
-                      avail_num="1" 
-                      avails_expected="1">
-            <break_duration auto_return="false" duration="{ad_duration * 90000}" />
-        </splice_insert>
-    </splice_information_table>
-</tsduck>'''
-            elif cue_type == "CUE-IN (Ad Break End)":
-                xml_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<tsduck>
-    <splice_information_table protocol_version="0" pts_adjustment="0" tier="0xFFF">
-        <splice_insert splice_event_id="{event_id}" 
-                      splice_event_cancel="false" 
-                      out_of_network="false" 
-                      splice_immediate="true" 
-                      pts_time="0" 
-                      unique_program_id="1" 
-                      avail_num="1" 
-                      avails_expected="1">
-            <break_duration auto_return="true" duration="0" />
-        </splice_insert>
-    </splice_information_table>
-</tsduck>'''
-            else:  # Time Signal
-                xml_content = f'''<?xml version="1.0" encoding="UTF-8"?>
-<tsduck>
-    <splice_information_table protocol_version="0" pts_adjustment="0" tier="0xFFF">
-        <splice_time_signal splice_event_id="{event_id}" 
-                           splice_event_cancel="false">
-            <splice_time pts_time="0" />
-        </splice_time_signal>
-    </splice_information_table>
-</tsduck>'''
+            xml_content = SCTE35_XML_TEMPLATES[cue_prefix].substitute(
+                event_id=event_id,
+                pts=preroll * 90000,
+                duration=ad_duration * 90000
+            )
             
             # Generate JSON metadata
             schedule_str = schedule_time.toString("HH:mm:ss") if schedule_time and not immediate else "Immediate"
-            json_data = {
-                "scte35_marker": {
-                    "event_id": event_id,
-                    "cue_type": cue_type,
-                    "preroll_seconds": preroll,
-                    "ad_duration_seconds": ad_duration,
-                    "schedule_time": schedule_str,
-                    "immediate": immediate,
-                    "created_at": datetime.now().isoformat()
-                }
-            }
-            
-            # Write files
-            xml_path.write_text(xml_content, encoding='utf-8')
-            json_path.write_text(json.dumps(json_data, indent=2), encoding='utf-8')
             
-            print(f"[SUCCESS] Generated SCTE-35 marker: {xml_filename}")
-            
-            # Emit signal
-            self.marker_generated.emit(str(xml_path), str(json_path))
+            json_content = SCTE35_JSON_TEMPLATE.substitute(
+                event_id=event_id,
+                cue_type=json.dumps(cue_type),
+                preroll=preroll,
+                ad_duration=ad_duration,
+                schedule_time=json.dumps(schedule_str),
+                immediate=json.dumps(immediate),
+                created_at=json.dumps(datetime.now().isoformat())
+            )
             
-            return str(xml_path)
+            # Write files on the thread pool; marker_generated is emitted
+            # from _on_marker_written once both files are on disk
+            task = MarkerWriteTask(xml_path, xml_content, json_path, json_content)
+            task.signals.written.connect(self._on_marker_written)
+            task.signals.failed.connect(self._on_marker_write_failed)
+            self._pending_writes.add(task.signals)
+            QThreadPool.globalInstance().start(task)
             
         except Exception as e:
             print(f"[ERROR] Failed to generate marker: {e}")
-            return None
+    
+    def _on_marker_written(self, xml_file, json_file):
+        self._pending_writes.discard(self.sender())
+        print(f"[SUCCESS] Generated SCTE-35 marker: {Path(xml_file).name}")
+        
+        # Emit signal
+        self.marker_generated.emit(xml_file, json_file)
+    
+    def _on_marker_write_failed(self, error):
+        self._pending_writes.discard(self.sender())
+        print(f"[ERROR] Failed to generate marker: {error}")
+
+
+# Banner rows for the monitoring panels
+BANNER = "═" * 51
+RULE = "─" * 51
+
+SYSTEM_METRICS_TEMPLATE = "\n".join((
+    "",
+    BANNER,
+    "           SYSTEM METRICS (Real-time)",
+    BANNER,
+    "",
+    "CPU Usage:      %s%%",
+    "",
+    "Memory Usage:   %s%%",
+    "                Used: %.2f GB / %.2f GB",
+    "",
+    "Disk Usage:     %s%%",
+    "                Used: %.2f GB / %.2f GB",
+    "",
+    BANNER,
+    "",
+))
+
+SCTE35_STATUS_TEMPLATE = "\n".join((
+    "",
+    BANNER,
+    "          SCTE-35 MARKER STATUS (Real-time)",
+    BANNER,
+    "",
+    "FILE-BASED MARKERS:",
+    "Total Markers:      %s",
+    "Latest Marker:      %s",
+    "Last Modified:      %s",
+    "Marker Directory:   %s",
+    "",
+    RULE,
+    "STREAM MONITORING:%s",
+    RULE,
+    "",
+    "[INFO] SCTE-35 monitoring active...",
+    "[INFO] Ready to inject markers into stream",
+    "",
+    BANNER,
+    "",
+))
+
+def format_system_metrics():
+    """Build the system metrics panel text"""
+    try:
+        cpu_percent, memory, disk = get_system_metrics()
+        
+        # Memory usage
+        memory_percent = memory.percent
+        memory_used = memory.used / (1024**3)  # GB
+        memory_total = memory.total / (1024**3)  # GB
+        
+        # Disk usage
+        disk_percent = disk.percent
+        disk_used = disk.used / (1024**3)  # GB
+        disk_total = disk.total / (1024**3)  # GB
+        
+        return SYSTEM_METRICS_TEMPLATE % (
+            cpu_percent,
+            memory_percent, memory_used, memory_total,
+            disk_percent, disk_used, disk_total
+        )
+    except Exception as e:
+        return f"Error updating metrics: {e}"
+
+
+# Lines kept in the monitoring console
+CONSOLE_MAX_LINES = 5000
+
+# Console prefix of TSDuck output lines
+TSDUCK_LINE_PREFIX = "[TSDuck] "
+
+# TSDuck output lines that mention SCTE-35 activity
+SCTE35_KEYWORD_RE = re.compile(r'splice|scte|cue|break', re.IGNORECASE)
+
+
+class MetricsSampler(QThread):
+    """Background thread that samples system metrics off the GUI thread"""
+    sample = pyqtSignal(str)  # formatted metrics text
+    
+    # The interval is slept in steps this long so stop() returns promptly
+    POLL_MS = 50
+    
+    def __init__(self, interval_ms=1000):
+        super().__init__()
+        self.interval_ms = interval_ms
+    
+    def run(self):
+        while not self.isInterruptionRequested():
+            self.sample.emit(format_system_metrics())
+            for _ in range(max(self.interval_ms // self.POLL_MS, 1)):
+                if self.isInterruptionRequested():
+                    return
+                self.msleep(self.POLL_MS)
+    
+    def stop(self):
+        """Stop sampling and wait for the thread to finish"""
+        self.requestInterruption()
+        self.wait()
 
 
 class MonitoringWidget(QWidget):
@@ -940,6 +1184,14 @@ class MonitoringWidget(QWidget):
         # Initialize monitoring counters early
         self.scte35_markers_detected = 0
         self.last_scte35_detection = None
+        self._last_scte35_text = ""
+        # Console lines waiting for the next flush (unbounded, so no TSDuck
+        # line is lost before it is checked for SCTE-35 activity)
+        self._log_buf = collections.deque()
+        # (markers_dir, dir mtime_ns, count, latest name, latest mtime) of the last scan
+        self._scte35_cache = None
+        # (port, url text) the stream links were last built from
+        self._last_link_key = None
         self.setup_ui()
         self.setup_monitoring()
     
@@ -955,9 +1207,11 @@ class MonitoringWidget(QWidget):
         """)
         
         # Console Tab
-        from PyQt6.QtWidgets import QTextEdit
-        self.console = QTextEdit()
+        self.console = QPlainTextEdit()
         self.console.setReadOnly(True)
+        # Keep the newest lines only; older blocks are dropped as new ones arrive
+        self.console.setMaximumBlockCount(CONSOLE_MAX_LINES)
+        self.console.setUndoRedoEnabled(False)
         self.console.setFont(QFont("Courier", 10))
         self.console.setStyleSheet("background-color: #1e1e1e; color: #00ff00; padding: 10px;")
         self.monitor_tabs.addTab(self.console, "📺 Console")
@@ -970,7 +1224,6 @@ class MonitoringWidget(QWidget):
         self.monitor_tabs.addTab(self.scte35_monitor, "🎬 SCTE-35 Status")
         
         # System Metrics Tab
-        from PyQt6.QtWidgets import QLabel
         self.system_metrics = QLabel()
         self.system_metrics.setFont(QFont("Courier", 10))
         self.system_metrics.setStyleSheet("background-color: #1e1e1e; color: #ffffff; padding: 10px;")
@@ -998,6 +1251,9 @@ class MonitoringWidget(QWidget):
         self.web_server_path.setPlaceholderText("output/hls")
         self.web_server_path.setText("output/hls")
         
+        # Clipboard used by the copy buttons (application-wide, so fetch it once)
+        self._clipboard = QApplication.clipboard()
+        
         # HLS Link Display
         hls_link_layout = QHBoxLayout()
         hls_link_layout.addWidget(QLabel("📺 HLS Link:"))
@@ -1065,7 +1321,11 @@ class MonitoringWidget(QWidget):
         self.start_server_btn.clicked.connect(self.start_web_server)
         self.stop_server_btn.clicked.connect(self.stop_web_server)
         
-        # Connect web server URL changes to update links
+        # Connect web server URL changes to update links; typing bursts
+        # are collapsed into one update
+        self._link_update_timer = QTimer()
+        self._link_update_timer.setSingleShot(True)
+        self._link_update_timer.timeout.connect(self._do_update_stream_links)
         self.web_server_url.textChanged.connect(self.update_stream_links)
         self.web_server_port.valueChanged.connect(self.update_stream_links)
         self.web_server_path.textChanged.connect(self.update_stream_links)
@@ -1073,26 +1333,42 @@ class MonitoringWidget(QWidget):
         # Connect copy buttons - find buttons after they're added to layout
         # We'll connect them directly in setup_ui instead
         
-        # Timer for system metrics updates
-        self.metrics_timer = QTimer()
-        self.metrics_timer.timeout.connect(self.update_metrics)
-        self.metrics_timer.start(1000)  # Update every second
+        # Prime psutil's CPU counter so the first tick reports a real delta
+        get_system_metrics()
+        
+        # System metrics are sampled on a worker thread; only the label
+        # update runs on the GUI thread
+        self.metrics_sampler = MetricsSampler(1000)  # Update every second
+        self.metrics_sampler.sample.connect(self.system_metrics.setText)
+        QApplication.instance().aboutToQuit.connect(self.metrics_sampler.stop)
+        self.metrics_sampler.start()
+        
+        # Console output is flushed in batches
+        self._flush_timer = QTimer()
+        self._flush_timer.timeout.connect(self._flush_console)
+        self._flush_timer.start(100)
         
         # Initial link update
-        self.update_stream_links()
+        self._do_update_stream_links()
     
     def copy_to_clipboard(self, text):
         """Copy text to clipboard"""
-        from PyQt6.QtWidgets import QApplication
-        clipboard = QApplication.clipboard()
-        clipboard.setText(text)
+        self._clipboard.setText(text)
         print(f"[INFO] Copied to clipboard: {text}")
     
     def update_stream_links(self):
+        """Schedule a stream link update once the settings stop changing"""
+        self._link_update_timer.start(150)
+    
+    def _do_update_stream_links(self):
         """Update HLS and DASH stream links based on server settings"""
         try:
             port = self.web_server_port.value()
             base_url = self.web_server_url.text().strip()
+            link_key = (port, base_url)
+            if link_key == self._last_link_key:
+                return
+            self._last_link_key = link_key
             if not base_url:
                 base_url = f"http://localhost:{port}"
             elif ":" not in base_url.split("//")[-1]:
@@ -1117,9 +1393,6 @@ class MonitoringWidget(QWidget):
     
     def start_web_server(self):
         """Start local web server for HLS/DASH content"""
-        import subprocess
-        import os
-        
         port = self.web_server_port.value()
         path = self.web_server_path.text().strip()
         
@@ -1142,12 +1415,7 @@ class MonitoringWidget(QWidget):
         # Start web server using embedded Python HTTP server
         # Use threading to run server in background
         try:
-            import http.server
-            import socketserver
-            import threading
-            
             # Check if port is already in use
-            import socket
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             result = sock.connect_ex(('localhost', port))
             sock.close()
@@ -1168,13 +1436,85 @@ class MonitoringWidget(QWidget):
                 def log_message(self, format, *args):
                     # Suppress log messages
                     pass
+                
+                # Playlists and init segments are small and re-polled every
+                # few seconds, so they are served from memory while unchanged
+                SMALL_FILE_LIMIT = 64 * 1024
+                SMALL_FILE_CACHE_SIZE = 64
+                small_files = {}  # (path, mtime_ns, size) -> data
+                
+                def _not_modified(self, st):
+                    """Return True if If-Modified-Since shows the client's copy is current"""
+                    # Same rules as SimpleHTTPRequestHandler.send_head
+                    if "If-Modified-Since" not in self.headers or "If-None-Match" in self.headers:
+                        return False
+                    try:
+                        ims = email.utils.parsedate_to_datetime(self.headers["If-Modified-Since"])
+                    except (TypeError, IndexError, OverflowError, ValueError):
+                        return False
+                    if ims.tzinfo is None:
+                        ims = ims.replace(tzinfo=timezone.utc)
+                    if ims.tzinfo is not timezone.utc:
+                        return False
+                    # Last-Modified has one-second resolution
+                    return int(st.st_mtime) <= ims.timestamp()
+                
+                def do_GET(self):
+                    path = self.translate_path(self.path)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        st = None
+                    if (st is None or not stat.S_ISREG(st.st_mode)
+                            or st.st_size > self.SMALL_FILE_LIMIT
+                            or self.path.split('?', 1)[0].endswith('/')):
+                        super().do_GET()
+                        return
+                    
+                    if self._not_modified(st):
+                        self.send_response(304)
+                        self.end_headers()
+                        return
+                    
+                    # Keyed on mtime and size too, so a rewritten file is re-read
+                    key = (path, st.st_mtime_ns, st.st_size)
+                    data = self.small_files.get(key)
+                    if data is None:
+                        try:
+                            with open(path, 'rb') as f:
+                                data = f.read()
+                        except OSError:
+                            super().do_GET()
+                            return
+                        if len(self.small_files) >= self.SMALL_FILE_CACHE_SIZE:
+                            self.small_files.clear()
+                        self.small_files[key] = data
+                    
+                    self.send_response(200)
+                    self.send_header("Content-type", self.guess_type(path))
+                    self.send_header("Content-Length", str(len(data)))
+                    self.send_header("Last-Modified", self.date_time_string(st.st_mtime))
+                    self.end_headers()
+                    self.wfile.write(data)
+                
+                def copyfile(self, source, outputfile):
+                    # socket.sendfile uses os.sendfile where available, so
+                    # segment payloads are copied in the kernel; it falls
+                    # back to plain sends elsewhere (wfile is unbuffered)
+                    self.connection.sendfile(source)
+            
+            # One thread per request, so a slow segment download does not
+            # block playlist polling from other players
+            class WebServer(http.server.ThreadingHTTPServer):
+                daemon_threads = True
+                allow_reuse_address = True
             
             # Create server in a thread
             def run_server():
                 try:
-                    os.chdir(path)
-                    Handler = CORSRequestHandler
-                    with socketserver.TCPServer(("", port), Handler) as httpd:
+                    # Serve from path without touching the process-wide cwd
+                    Handler = functools.partial(CORSRequestHandler, directory=os.path.abspath(path))
+                    with WebServer(("", port), Handler) as httpd:
                         self.web_server_process = httpd
                         httpd.serve_forever()
                 except Exception as e:
@@ -1184,14 +1524,14 @@ class MonitoringWidget(QWidget):
             server_thread = threading.Thread(target=run_server, daemon=True)
             server_thread.start()
             
-            # Wait a moment to check if server started
-            import time
-            time.sleep(0.5)
-            
-            # Check if server is running
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            result = sock.connect_ex(('localhost', port))
-            sock.close()
+            # Check if server is running, polling every 20 ms for up to 500 ms
+            result = -1
+            for _ in range(25):
+                time.sleep(0.02)
+                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                    result = sock.connect_ex(('localhost', port))
+                if result == 0:
+                    break
             
             if result == 0:
                 self.web_server_status.setText(f"✅ Web Server: Running on http://localhost:{port}")
@@ -1200,14 +1540,13 @@ class MonitoringWidget(QWidget):
                 self.stop_server_btn.setEnabled(True)
                 self.web_server_url.setText(f"http://localhost:{port}")
                 # Update stream links when server starts
-                self.update_stream_links()
+                self._do_update_stream_links()
                 print(f"[INFO] Web server started on port {port}, serving {path}")
             else:
                 self.web_server_status.setText(f"❌ Error: Server failed to start on port {port}")
                 self.web_server_status.setStyleSheet("padding: 10px; border: 2px solid #f44336; border-radius: 4px; background-color: #3a3a3a;")
             
         except Exception as e:
-            import traceback
             error_msg = str(e)
             print(f"[ERROR] Web server startup error: {error_msg}")
             traceback.print_exc()
@@ -1244,59 +1583,21 @@ class MonitoringWidget(QWidget):
         
         # SCTE-35 monitoring - DISABLED for now to prevent crashes
         # TODO: Fix SCTE-35 status tab display issue
-        self.scte35_timer = QTimer()
-        self.scte35_timer.timeout.connect(self.update_scte35_status)
-        self.scte35_timer.start(2000)  # Update every 2 seconds
-    
-    def update_metrics(self):
-        """Update system metrics"""
-        try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            
-            # Memory usage
-            memory = psutil.virtual_memory()
-            memory_percent = memory.percent
-            memory_used = memory.used / (1024**3)  # GB
-            memory_total = memory.total / (1024**3)  # GB
-            
-            # Disk usage
-            disk = psutil.disk_usage('/')
-            disk_percent = disk.percent
-            disk_used = disk.used / (1024**3)  # GB
-            disk_total = disk.total / (1024**3)  # GB
-            
-            metrics_text = f"""
-═══════════════════════════════════════════════════
-           SYSTEM METRICS (Real-time)
-═══════════════════════════════════════════════════
-
-CPU Usage:      {cpu_percent}%
-
-Memory Usage:   {memory_percent}%
-                Used: {memory_used:.2f} GB / {memory_total:.2f} GB
-
-Disk Usage:     {disk_percent}%
-                Used: {disk_used:.2f} GB / {disk_total:.2f} GB
-
-═══════════════════════════════════════════════════
-"""
-            self.system_metrics.setText(metrics_text)
-        except Exception as e:
-            self.system_metrics.setText(f"Error updating metrics: {e}")
+        if SCTE35_MONITOR_ENABLED and getattr(self, 'scte35_timer', None) is None:
+            self.scte35_timer = QTimer()
+            self.scte35_timer.timeout.connect(self.update_scte35_status)
+            self.scte35_timer.start(2000)  # Update every 2 seconds
     
     def update_scte35_status(self):
         """Update SCTE-35 monitoring status - TEMPORARILY DISABLED"""
         # Disabled to prevent crashes - will be fixed in future version
-        return
+        if not SCTE35_MONITOR_ENABLED:
+            return
         
         try:
             if not hasattr(self, 'scte35_monitor') or not self.scte35_monitor:
                 return
                 
-            from pathlib import Path
-            from datetime import datetime
-            
             # Try multiple possible paths
             possible_paths = [
                 Path("scte35_final"),
@@ -1315,32 +1616,49 @@ Disk Usage:     {disk_percent}%
             if markers_dir is None:
                 status = "[ERROR] No markers directory found. Checked: scte35_final, ../scte35_final, and parent directories."
                 if self.scte35_monitor:
-                    self.scte35_monitor.clear()
-                    self.scte35_monitor.insertPlainText(status)
+                    self._set_scte35_text(status)
                 print(f"[DEBUG] Markers directory not found in any location")
                 return
             
-            xml_files = list(markers_dir.glob("*.xml"))
-            print(f"[DEBUG] Found {len(xml_files)} XML marker files")
+            # The directory mtime only changes when markers are added or
+            # removed, so an unchanged directory reuses the last scan
+            dir_mtime = markers_dir.stat().st_mtime_ns
+            cache = self._scte35_cache
+            if cache and cache[0] == markers_dir and cache[1] == dir_mtime:
+                _, _, marker_count, latest_name, latest_mtime = cache
+            else:
+                # Count markers and find the newest one in a single pass;
+                # DirEntry caches its stat result, so each file is stat'ed once
+                marker_count = 0
+                latest_name = None
+                latest_mtime = -1
+                with os.scandir(markers_dir) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith(".xml"):
+                            continue
+                        marker_count += 1
+                        mtime = entry.stat().st_mtime
+                        if mtime > latest_mtime:
+                            latest_mtime, latest_name = mtime, entry.name
+                self._scte35_cache = (markers_dir, dir_mtime, marker_count, latest_name, latest_mtime)
+            print(f"[DEBUG] Found {marker_count} XML marker files")
             print(f"[DEBUG] Widget exists: {self.scte35_monitor is not None}")
             print(f"[DEBUG] About to set content to widget")
             
-            if not xml_files:
+            if not marker_count:
                 status = f"""[WARNING] No SCTE-35 markers found. Generate markers from the SCTE-35 tab.
 
 Marker Directory: {markers_dir}
 Available Paths: {list(markers_dir.glob('*'))}
 """
-                self.scte35_monitor.clear()
-                self.scte35_monitor.insertPlainText(status)
+                self._set_scte35_text(status)
                 print(f"[DEBUG] No XML files found in {markers_dir}")
                 print(f"[DEBUG] Directory contents: {list(markers_dir.glob('*'))}")
                 return
             
             # Get latest marker
-            latest_file = max(xml_files, key=lambda f: f.stat().st_mtime)
-            latest_time = datetime.fromtimestamp(latest_file.stat().st_mtime)
-            print(f"[DEBUG] Latest marker: {latest_file.name}")
+            latest_time = datetime.fromtimestamp(latest_mtime)
+            print(f"[DEBUG] Latest marker: {latest_name}")
             
             # Show both file-based and stream-based markers
             stream_detected = self.scte35_markers_detected if hasattr(self, 'scte35_markers_detected') else 0
@@ -1351,54 +1669,123 @@ Markers Detected in Stream: {stream_detected}
 Last Detection: {self.last_scte35_detection if hasattr(self, 'last_scte35_detection') and self.last_scte35_detection else 'None'}
 """
             
-            status = f"""
-═══════════════════════════════════════════════════
-          SCTE-35 MARKER STATUS (Real-time)
-═══════════════════════════════════════════════════
-
-FILE-BASED MARKERS:
-Total Markers:      {len(xml_files)}
-Latest Marker:      {latest_file.name}
-Last Modified:      {latest_time.strftime('%Y-%m-%d %H:%M:%S')}
-Marker Directory:   {markers_dir.absolute()}
-
-───────────────────────────────────────────────────
-STREAM MONITORING:{stream_info}
-───────────────────────────────────────────────────
-
-[INFO] SCTE-35 monitoring active...
-[INFO] Ready to inject markers into stream
-
-═══════════════════════════════════════════════════
-"""
+            status = SCTE35_STATUS_TEMPLATE % (
+                marker_count,
+                latest_name,
+                latest_time.strftime('%Y-%m-%d %H:%M:%S'),
+                markers_dir.absolute(),
+                stream_info
+            )
             print(f"[DEBUG] Setting content to widget, length: {len(status)} chars")
             print(f"[DEBUG] Content preview: {status[:200]}...")
-            self.scte35_monitor.clear()
-            self.scte35_monitor.insertPlainText(status)
+            self._set_scte35_text(status)
             print(f"[DEBUG] Content set successfully")
             
-            # Force refresh the widget
-            self.scte35_monitor.repaint()
-            self.scte35_monitor.update()
-            
         except Exception as e:
-            import traceback
             error_msg = f"""[ERROR] SCTE-35 monitoring error: {e}
 
 Working Directory: {os.getcwd()}
 Error Type: {type(e).__name__}
 """
-            self.scte35_monitor.setPlainText(error_msg)
+            self._set_scte35_text(error_msg)
             print(f"[ERROR] SCTE-35 Status Error: {e}")
             traceback.print_exc()
             print(f"[DEBUG] Current working directory: {os.getcwd()}")
     
+    def _set_scte35_text(self, text):
+        """Replace the SCTE-35 status text, skipping the re-layout when unchanged"""
+        if text == self._last_scte35_text:
+            return
+        self.scte35_monitor.setPlainText(text)
+        self._last_scte35_text = text
+    
     def append(self, text):
-        self.console.append(text)
+        # Lines are queued and written to the console in batches by
+        # _flush_console; deque.append is safe from the stream reader thread
+        self._log_buf.append(text)
+    
+    def append_tsduck(self, line_text):
+        """Queue a TSDuck output line (called directly from the reader thread)"""
+        self._log_buf.append(TSDUCK_LINE_PREFIX + line_text)
+    
+    def _flush_console(self):
+        """Write all queued lines to the console in one insert"""
+        if not self._log_buf:
+            return
+        lines = []
+        while self._log_buf:
+            lines.append(self._log_buf.popleft())
+        
+        self._detect_scte35(lines)
+        
+        # The console keeps only its last CONSOLE_MAX_LINES blocks anyway
+        if len(lines) > CONSOLE_MAX_LINES:
+            skipped = len(lines) - CONSOLE_MAX_LINES
+            lines = [f"[INFO] {skipped} console line(s) skipped"] + lines[-CONSOLE_MAX_LINES:]
+        
+        # Insert through a separate cursor so the user's cursor and selection
+        # stay put, and only follow the output if the view was at the bottom
+        scrollbar = self.console.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        document = self.console.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        prefix = "\n" if not document.isEmpty() else ""
+        cursor.insertText(prefix + "\n".join(lines))
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+    
+    def _detect_scte35(self, lines):
+        """Count SCTE-35 activity in flushed TSDuck output lines"""
+        # Most batches have none, so the whole batch is checked once before
+        # looking at individual lines
+        if not SCTE35_KEYWORD_RE.search("\n".join(lines)):
+            return
+        previous_count = self.scte35_markers_detected
+        previous_detection = self.last_scte35_detection
+        for line in lines:
+            if line.startswith(TSDUCK_LINE_PREFIX) and SCTE35_KEYWORD_RE.search(line, len(TSDUCK_LINE_PREFIX)):
+                self.scte35_markers_detected += 1
+                self.last_scte35_detection = line[len(TSDUCK_LINE_PREFIX):]
+        
+        # Repeated identical detections only refresh the status every ten
+        if (self.last_scte35_detection != previous_detection
+                or self.scte35_markers_detected // 10 != previous_count // 10):
+            self.update_scte35_status()
+
+
+def _version_tuple(version):
+    """Parse 'v2.0.10' into (2, 0, 10), ignoring any non-numeric suffix"""
+    parts = []
+    for part in version.strip().lstrip('vV').split('.'):
+        digits = ''
+        for ch in part:
+            if not ch.isdigit():
+                break
+            digits += ch
+        if not digits:
+            break
+        parts.append(int(digits))
+    return tuple(parts)
 
 
-class UpdateChecker(QThread):
-    """Background thread for checking updates"""
+def is_newer_version(latest, current):
+    """Return True if release tag latest is newer than current"""
+    if Version is not None:
+        try:
+            return Version(latest.strip().lstrip('vV')) > Version(current.strip().lstrip('vV'))
+        except InvalidVersion:
+            pass
+    return _version_tuple(latest) > _version_tuple(current)
+
+
+# Update checker threads that were still inside a network call at shutdown;
+# kept referenced so they are never destroyed while running
+_abandoned_update_threads = []
+
+
+class UpdateChecker(QObject):
+    """Update check worker; lives on its own QThread and is reused for every check"""
     update_available = pyqtSignal(str, str, str)  # version, url, notes
     check_complete = pyqtSignal(bool)  # update available
     
@@ -1410,23 +1797,20 @@ class UpdateChecker(QThread):
         self.download_url = None
         self.release_notes = ""
     
-    def run(self):
+    def run_check(self):
         """Check for available updates"""
         try:
-            import urllib.request
-            import json
-            
             req = urllib.request.Request(self.api_url)
             req.add_header('User-Agent', 'IBE-100/2.0.4')
             
             with urllib.request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read())
+                data = json.load(response)
                 self.latest_version = data.get('tag_name', '')
                 self.download_url = data.get('html_url', '')
                 self.release_notes = data.get('body', 'No release notes available.')
                 
-                # Compare versions (simple string comparison for now)
-                if self.latest_version > self.current_version:
+                # Compare versions numerically ("2.0.10" is newer than "2.0.9")
+                if is_newer_version(self.latest_version, self.current_version):
                     self.update_available.emit(self.latest_version, self.download_url, self.release_notes)
                     self.check_complete.emit(True)
                 else:
@@ -1437,19 +1821,203 @@ class UpdateChecker(QThread):
             self.check_complete.emit(False)
 
 
+class TsduckReader(QThread):
+    """Run a TSDuck command with auto-reconnect and emit its output lines"""
+    line_received = pyqtSignal(str)  # stripped TSDuck output line
+    message = pyqtSignal(str)  # status line for the console
+    finished_with_code = pyqtSignal(int)  # exit code of an unexpected stop
+    
+    MAX_RETRIES = 999  # Effectively unlimited retries
+    
+    def __init__(self, command, owned_processes=None):
+        super().__init__()
+        self.command = command
+        # Set shared with the owner; running Popen objects are added/removed
+        self.owned_processes = owned_processes if owned_processes is not None else set()
+        self.process = None
+        self.retry_count = 0
+        # Set by stop(); also wakes a reconnect backoff immediately
+        self._stop_event = threading.Event()
+    
+    @property
+    def active(self):
+        return not self._stop_event.is_set()
+    
+    def stop(self):
+        """Stop reading and do not reconnect"""
+        self._stop_event.set()
+        # Ending the process also ends a blocked read of its output
+        process = self.process
+        if process:
+            try:
+                process.terminate()
+            except OSError:
+                pass
+    
+    def _backoff(self):
+        # Wait before reconnecting (with exponential backoff, max 30 seconds)
+        wait_time = min(5 * min(self.retry_count, 6), 30)
+        self._stop_event.wait(timeout=wait_time)
+        return wait_time
+    
+    def run(self):
+        while self.active and self.retry_count < self.MAX_RETRIES:
+            try:
+                # Binary pipe with Python-side buffering; output is decoded
+                # in chunks by the wrapper rather than line by line
+                process = subprocess.Popen(
+                    self.command,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    bufsize=-1,
+                    creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+                )
+                # Published before anything else, so stop() can always end it
+                self.process = process
+                self.owned_processes.add(process)
+                if not self.active:
+                    # stop() ran before the process was published
+                    process.terminate()
+                output = io.TextIOWrapper(process.stdout, encoding='utf-8', errors='replace')
+                
+                if self.retry_count > 0:
+                    self.message.emit(f"[INFO] Reconnected - Retry attempt {self.retry_count}")
+                    self.retry_count = 0  # Reset counter on successful connection
+                
+                # Read output line by line
+                for line in output:
+                    if not self.active:
+                        break
+                    self.line_received.emit(line.strip())
+                
+                # Process finished (or closed its output); wait in short steps
+                # so a stop request is seen even if it lingers
+                while True:
+                    try:
+                        process.wait(timeout=0.5)
+                        break
+                    except subprocess.TimeoutExpired:
+                        if not self.active:
+                            process.kill()
+                exit_code = process.returncode
+                self.owned_processes.discard(process)
+                self.process = None
+                
+                if not self.active:
+                    # User stopped manually
+                    self.message.emit("[INFO] Stream stopped by user")
+                    break
+                
+                # Stream stopped unexpectedly - reconnect
+                self.retry_count += 1
+                self.finished_with_code.emit(exit_code)
+                self._backoff()
+                
+            except Exception as e:
+                self.message.emit(f"[ERROR] Stream error: {e}")
+                if not self.active:
+                    break
+                
+                # Wait before retry
+                self.retry_count += 1
+                wait_time = min(5 * min(self.retry_count, 6), 30)
+                self.message.emit(f"[INFO] Retrying in {wait_time} seconds...")
+                self._backoff()
+
+
+@functools.lru_cache(maxsize=1)
+def load_logo_pixmap():
+    """Load logo.png scaled for the header (cached), or None if it is missing"""
+    logo_path = Path("logo.png")
+    if not logo_path.exists():
+        return None
+    pixmap = QPixmap(str(logo_path))
+    return pixmap.scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+
+# Application-wide style; set once on the QApplication in main()
+APP_STYLESHEET = """
+QMainWindow {
+    background-color: #1a1a1a;
+}
+QWidget {
+    color: #ffffff;
+    background-color: #2a2a2a;
+}
+QLineEdit {
+    color: #000000;
+    background-color: #ffffff;
+    border: 2px solid #555;
+    border-radius: 4px;
+    padding: 5px;
+    font-size: 13px;
+}
+QLineEdit:focus {
+    border: 2px solid #4CAF50;
+}
+QSpinBox {
+    color: #000000;
+    background-color: #ffffff;
+    border: 2px solid #555;
+    border-radius: 4px;
+    padding: 5px;
+    font-size: 13px;
+}
+QGroupBox {
+    border: 2px solid #444;
+    border-radius: 8px;
+    margin-top: 10px;
+    padding-top: 10px;
+    font-weight: bold;
+    font-size: 14px;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+}
+QLabel {
+    color: #ffffff;
+    font-size: 13px;
+}
+"""
+
+
 class MainWindow(QMainWindow):
     """Main Application Window"""
+    trigger_update_check = pyqtSignal()  # runs UpdateChecker.run_check on its thread
+    
+    # Longest wait for the TSDuck reader thread when it is stopped
+    READER_STOP_TIMEOUT_MS = 5000
+    # Longest wait for an in-flight update check on exit
+    UPDATE_STOP_TIMEOUT_MS = 1000
     
     def __init__(self):
         super().__init__()
-        self.processor = None
+        self.tsduck_reader = None
+        # Running TSDuck processes (Popen objects) started by this window
+        self._owned_processes = set()
+        # Whether the system-wide scan for leftover TSDuck processes has run
+        self._leftovers_checked = False
         self.latest_marker = None
-        self.update_checker = None
+        # (scte35_final mtime_ns, latest marker Path) of the last scan
+        self._marker_cache = (None, None)
+        # TSDuck argv prefix built from the current config (see build_command)
+        self._static_argv = None
         self.streaming_active = False
-        self.retry_count = 0
         self.setup_ui()
         self.setup_connections()
         
+        # One update checker for the window's lifetime, on its own thread
+        self.update_checker = UpdateChecker("2.0.4")
+        self._update_thread = QThread()
+        self.update_checker.moveToThread(self._update_thread)
+        self.trigger_update_check.connect(self.update_checker.run_check)
+        self.update_checker.update_available.connect(self.show_update_dialog)
+        self.update_checker.check_complete.connect(self.on_update_check_complete)
+        QApplication.instance().aboutToQuit.connect(self._stop_update_thread)
+        self._update_thread.start()
+        
         # Check for updates 5 seconds after startup
         QTimer.singleShot(5000, self.check_for_updates)
     
@@ -1469,11 +2037,9 @@ class MainWindow(QMainWindow):
         
         # Logo
         logo_label = QLabel()
-        logo_path = Path("logo.png")
-        if logo_path.exists():
-            pixmap = QPixmap(str(logo_path))
-            scaled_pixmap = pixmap.scaled(50, 50, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            logo_label.setPixmap(scaled_pixmap)
+        logo_pixmap = load_logo_pixmap()
+        if logo_pixmap is not None:
+            logo_label.setPixmap(logo_pixmap)
         else:
             logo_label.setText("🏠")
             logo_label.setStyleSheet("font-size: 40px;")
@@ -1560,57 +2126,13 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(footer_widget)
         
         central_widget.setLayout(main_layout)
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1a1a1a;
-            }
-            QWidget {
-                color: #ffffff;
-                background-color: #2a2a2a;
-            }
-            QLineEdit {
-                color: #000000;
-                background-color: #ffffff;
-                border: 2px solid #555;
-                border-radius: 4px;
-                padding: 5px;
-                font-size: 13px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #4CAF50;
-            }
-            QSpinBox {
-                color: #000000;
-                background-color: #ffffff;
-                border: 2px solid #555;
-                border-radius: 4px;
-                padding: 5px;
-                font-size: 13px;
-            }
-            QGroupBox {
-                border: 2px solid #444;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QLabel {
-                color: #ffffff;
-                font-size: 13px;
-            }
-        """)
     
     def setup_connections(self):
         self.start_btn.clicked.connect(self.start_processing)
         self.stop_btn.clicked.connect(self.stop_processing)
         self.preview_btn.clicked.connect(self.preview_command)
         self.scte35_widget.marker_generated.connect(self.on_marker_generated)
+        self.config_widget.config_changed.connect(self._invalidate_static_argv)
     
     def kill_all_tsduck_bg_processes(self):
         """Force kill all background TSDuck processes - utility method"""
@@ -1624,13 +2146,34 @@ class MainWindow(QMainWindow):
     
     def check_for_updates(self):
         """Check for available updates"""
-        if self.update_checker is None:
-            self.update_checker = UpdateChecker("2.0.4")
-            self.update_checker.update_available.connect(self.show_update_dialog)
-            self.update_checker.check_complete.connect(self.on_update_check_complete)
-        
-        if not self.update_checker.isRunning():
-            self.update_checker.start()
+        self.trigger_update_check.emit()
+    
+    def _stop_update_thread(self):
+        """Stop the update checker thread on exit"""
+        thread = self._update_thread
+        if thread is None:
+            return
+        self._update_thread = None
+        thread.quit()
+        if not thread.wait(self.UPDATE_STOP_TIMEOUT_MS):
+            # run_check is blocked in urlopen (up to its 10 s timeout); let
+            # the app exit without it instead of waiting the request out
+            _abandoned_update_threads.append((thread, self.update_checker))
+    
+    def _stop_tsduck_reader(self):
+        """Stop the TSDuck reader thread (and its process) and wait for it to exit"""
+        reader = self.tsduck_reader
+        if reader:
+            reader.stop()
+            if not reader.wait(self.READER_STOP_TIMEOUT_MS):
+                print("[WARNING] TSDuck reader thread did not stop in time")
+    
+    def closeEvent(self, event):
+        self.streaming_active = False
+        self._stop_tsduck_reader()
+        self._stop_update_thread()
+        self.monitoring_widget.metrics_sampler.stop()
+        super().closeEvent(event)
     
     def on_update_check_complete(self, update_available):
         """Handle update check completion"""
@@ -1639,8 +2182,6 @@ class MainWindow(QMainWindow):
     
     def show_update_dialog(self, version, url, notes):
         """Show update available dialog"""
-        from PyQt6.QtWidgets import QMessageBox, QTextEdit, QPushButton
-        
         msg = QMessageBox(self)
         msg.setWindowTitle("🔄 Update Available")
         msg.setIcon(QMessageBox.Icon.Information)
@@ -1673,72 +2214,60 @@ class MainWindow(QMainWindow):
     def on_marker_generated(self, xml_file: str, json_file: str):
         """Handle marker generation"""
         self.latest_marker = xml_file
+        # Rescan on the next lookup even if the directory mtime did not tick
+        self._marker_cache = (None, None)
         self.monitoring_widget.append(f"[INFO] Marker generated: {xml_file}")
         print(f"[INFO] Latest marker set to: {xml_file}")
     
     def get_latest_marker(self) -> str:
         """Get the latest SCTE-35 marker file - DYNAMIC, NO hardcoded fallback"""
-        from pathlib import Path
-        from datetime import datetime
-        
         # Look for scte35_final directory
         markers_dir = Path("scte35_final")
         
-        if not markers_dir.exists():
+        try:
+            dir_mtime = markers_dir.stat().st_mtime_ns
+        except OSError:
             return "ERROR: No markers directory found. Generate a marker first."
         
-        # Find all XML marker files
-        xml_files = list(markers_dir.glob("*.xml"))
-        
-        if not xml_files:
+        # The directory listing only changes when its mtime does
+        if dir_mtime == self._marker_cache[0]:
+            latest_file = self._marker_cache[1]
+        else:
+            # Find the latest XML marker file by modification time in one
+            # pass; DirEntry.stat() usually needs no extra syscall
+            latest_name = None
+            latest_mtime = -1.0
+            with os.scandir(markers_dir) as entries:
+                for entry in entries:
+                    if os.path.normcase(entry.name).endswith('.xml'):
+                        mtime = entry.stat().st_mtime
+                        if mtime > latest_mtime:
+                            latest_name, latest_mtime = entry.name, mtime
+            latest_file = markers_dir / latest_name if latest_name else None
+            self._marker_cache = (dir_mtime, latest_file)
+        
+        if latest_file is None:
             return "ERROR: No marker files found. Generate a marker first."
         
-        # Get the latest file by modification time
-        latest_file = max(xml_files, key=lambda f: f.stat().st_mtime)
         print(f"[INFO] Selected marker: {latest_file.name}")
         
         # Return relative path for TSDuck
         return str(latest_file)
     
-    def build_command(self):
-        """Build complete TSDuck command with all distributor requirements"""
-        config = self.config_widget.get_config()
-        marker = self.get_latest_marker()
-        
-        # Get values from config
-        input_type = config.get("input_type", "HLS (HTTP Live Streaming)")
-        input_url = config.get("input_url", "https://cdn.example.com/stream/index.m3u8")
-        output_type = config.get("output_type", "SRT")
-        output_srt = config.get("output_srt", "cdn.example.com:8888")
-        output_hls = config.get("output_hls", "output/hls")
-        output_dash = config.get("output_dash", "output/dash")
-        enable_cors = config.get("enable_cors", True)
-        segment_duration = config.get("segment_duration", 6)
-        playlist_window = config.get("playlist_window", 5)
-        service_id = config.get("service_id", 1)
-        service_name = config.get("service_name", "SCTE-35 Stream")
-        provider_name = config.get("provider_name", "ITAssist")
-        vpid = config.get("vpid", 256)
-        apid = config.get("apid", 257)
-        scte35_pid = config.get("scte35_pid", 500)
-        stream_id = config.get("stream_id", "#!::r=scte/scte,m=publish")
-        latency = config.get("latency", 2000)
-        start_delay = config.get("start_delay", 2000)
-        inject_count = config.get("inject_count", 1)
-        inject_interval = config.get("inject_interval", 1000)
-        
-        # Determine input plugin based on input type
-        input_plugin_map = {
-            "HLS (HTTP Live Streaming)": "hls",
-            "SRT (Secure Reliable Transport)": "srt",
-            "UDP (User Datagram Protocol)": "ip",
-            "TCP (Transmission Control Protocol)": "tcp",
-            "HTTP/HTTPS": "http",
-            "DVB": "dvb",
-            "ASI": "asi"
-        }
-        
-        input_plugin = input_plugin_map.get(input_type, "hls")
+    def _invalidate_static_argv(self):
+        """Drop the cached command prefix after a config change"""
+        self._static_argv = None
+    
+    def _build_static_argv(self, config):
+        """Build the TSDuck argv up to and including spliceinject's --files"""
+        input_type = config.input_type
+        input_url = config.input_url
+        service_id = config.service_id
+        service_name = config.service_name
+        provider_name = config.provider_name
+        vpid = config.vpid
+        apid = config.apid
+        scte35_pid = config.scte35_pid
         
         # Start building command
         command = [TSDUCK_PATH]
@@ -1747,44 +2276,23 @@ class MainWindow(QMainWindow):
         if input_type == "SRT (Secure Reliable Transport)":
             # Parse SRT URL: srt://host:port?streamid=...
             # Based on working implementation from old app (enc100.py)
-            try:
-                # Remove srt:// prefix to get host:port?streamid=...
-                clean_url = input_url.replace("srt://", "").replace("srt:", "")
-                
-                # Split into host:port and streamid
-                if "?" in clean_url:
-                    host_port = clean_url.split("?")[0]
-                    query_part = clean_url.split("?")[1]
-                    
-                    # Extract streamid if present
-                    streamid_param = None
-                    if "streamid=" in query_part:
-                        streamid_param = query_part.split("streamid=")[1]
-                    
-                    # Build SRT command like old app: -I srt host:port --transtype live --messageapi --latency 2000
-                    command.extend(["-I", "srt", host_port, 
-                                   "--transtype", "live",
-                                   "--messageapi",
-                                   "--latency", "2000"])
-                    
-                    # Add streamid if present
-                    if streamid_param:
-                        command.extend(["--streamid", streamid_param])
-                else:
-                    # No streamid, just host:port
-                    command.extend(["-I", "srt", clean_url,
-                                   "--transtype", "live",
-                                   "--messageapi",
-                                   "--latency", "2000"])
-            except Exception as e:
-                # Fallback - use input as-is with SRT parameters
-                clean_url = input_url.replace("srt://", "").replace("srt:", "")
-                command.extend(["-I", "srt", clean_url,
-                               "--transtype", "live",
-                               "--messageapi",
-                               "--latency", "2000"])
+            # Remove srt:// prefix to get host:port?streamid=...
+            clean_url = input_url.replace("srt://", "").replace("srt:", "")
+            url_parts = clean_url.split("?")
+            
+            # Build SRT command like old app: -I srt host:port --transtype live --messageapi --latency 2000
+            command.extend(["-I", "srt", url_parts[0],
+                           "--transtype", "live",
+                           "--messageapi",
+                           "--latency", "2000"])
+            
+            # Add streamid if present
+            if len(url_parts) > 1 and "streamid=" in url_parts[1]:
+                streamid_param = url_parts[1].split("streamid=")[1]
+                if streamid_param:
+                    command.extend(["--streamid", streamid_param])
         else:
-            command.extend(["-I", input_plugin, input_url])
+            command.extend(["-I", INPUT_PLUGIN_MAP.get(input_type, "hls"), input_url])
         
         # SDT Plugin - Service Description Table
         command.extend(["-P", "sdt",
@@ -1806,11 +2314,41 @@ class MainWindow(QMainWindow):
             "--add-pid", f"{apid}/0x0f",  # Audio PID
             "--add-pid", f"{scte35_pid}/0x86"])  # SCTE-35 PID
         
-        # SpliceInject Plugin
+        # SpliceInject Plugin (PIDs only; the marker file follows --files)
         command.extend(["-P", "spliceinject",
             "--pid", str(scte35_pid),
             "--pts-pid", str(vpid),
-            "--files", marker,
+            "--files"])
+        
+        return command
+    
+    def build_command(self, config=None):
+        """Build complete TSDuck command with all distributor requirements"""
+        if config is None:
+            config = self.config_widget.get_stream_config()
+        marker = self.get_latest_marker()
+        
+        # Get values from config
+        output_type = config.output_type
+        output_srt = config.output_srt
+        output_hls = config.output_hls
+        output_dash = config.output_dash
+        enable_cors = config.enable_cors
+        segment_duration = config.segment_duration
+        playlist_window = config.playlist_window
+        stream_id = config.stream_id
+        latency = config.latency
+        start_delay = config.start_delay
+        inject_count = config.inject_count
+        inject_interval = config.inject_interval
+        
+        # Everything up to spliceinject's --files only changes with the config
+        if self._static_argv is None:
+            self._static_argv = self._build_static_argv(config)
+        command = list(self._static_argv)
+        
+        # SpliceInject Plugin (marker and injection timing)
+        command.extend([marker,
             "--inject-count", str(inject_count),
             "--inject-interval", str(inject_interval),
             "--start-delay", str(start_delay)])
@@ -1848,8 +2386,6 @@ class MainWindow(QMainWindow):
     
     def preview_command(self):
         """Preview the TSDuck command"""
-        from PyQt6.QtWidgets import QDialog, QVBoxLayout, QTextEdit, QPushButton
-        
         dialog = QDialog(self)
         dialog.setWindowTitle("TSDuck Command Preview")
         dialog.setMinimumSize(600, 400)
@@ -1879,19 +2415,22 @@ class MainWindow(QMainWindow):
     
     def start_processing(self):
         """Start processing with TSDuck"""
-        import subprocess
-        import threading
-        
-        config = self.config_widget.get_config()
+        config = self.config_widget.get_stream_config()
         marker = self.get_latest_marker()
         
         if "ERROR" in marker:
             self.monitoring_widget.append(f"[ERROR] {marker}")
             return
         
-        # Kill any existing TSDuck processes before starting
+        # Kill any existing TSDuck processes before starting; only the first
+        # start scans the whole system (for leftovers of an earlier session),
+        # after that every TSDuck process is one we started ourselves
         self.monitoring_widget.append("[INFO] Checking for existing TSDuck processes...")
-        killed = kill_all_tsduck_processes()
+        if self._leftovers_checked:
+            killed = self._kill_owned_processes()
+        else:
+            killed = kill_all_tsduck_processes()
+            self._leftovers_checked = True
         if killed > 0:
             self.monitoring_widget.append(f"[INFO] Terminated {killed} existing TSDuck process(es)")
         else:
@@ -1901,146 +2440,101 @@ class MainWindow(QMainWindow):
         self.monitoring_widget.append(f"[INFO] Using marker: {marker}")
         
         # Create output directories if needed (for HLS/DASH)
-        config = self.config_widget.get_config()
-        output_type = config.get("output_type", "SRT")
+        output_type = config.output_type
         
         if output_type == "HLS":
-            output_path = config.get("output_hls", "output/hls")
+            output_path = config.output_hls
             if output_path:
                 try:
-                    import os
                     os.makedirs(output_path, exist_ok=True)
                     self.monitoring_widget.append(f"[INFO] Created/verified output directory: {output_path}")
                 except Exception as e:
                     self.monitoring_widget.append(f"[WARNING] Could not create directory {output_path}: {e}")
         
         elif output_type == "DASH":
-            output_path = config.get("output_dash", "output/dash")
+            output_path = config.output_dash
             if output_path:
                 try:
-                    import os
                     os.makedirs(output_path, exist_ok=True)
                     self.monitoring_widget.append(f"[INFO] Created/verified output directory: {output_path}")
                 except Exception as e:
                     self.monitoring_widget.append(f"[WARNING] Could not create directory {output_path}: {e}")
         
-        command = self.build_command()
+        command = self.build_command(config)
         cmd_str = ' '.join(command)
         self.monitoring_widget.append(f"[INFO] TSDuck Command: {cmd_str}")
         
         # Set streaming active flag
         self.streaming_active = True
-        self.retry_count = 0
         
-        # Start TSDuck process in background thread with auto-reconnect
-        def run_tsp_continuous():
-            import time
-            max_retries = 999  # Effectively unlimited retries
-            
-            while self.streaming_active and self.retry_count < max_retries:
-                try:
-                    process = subprocess.Popen(
-                        command,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        text=True,
-                        bufsize=1,
-                        universal_newlines=True,
-                        creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-                    )
-                    
-                    self.processor = process
-                    
-                    if self.retry_count > 0:
-                        self.monitoring_widget.append(f"[INFO] Reconnected - Retry attempt {self.retry_count}")
-                        self.retry_count = 0  # Reset counter on successful connection
-                    
-                    # Read output line by line
-                    for line in process.stdout:
-                        if not self.streaming_active:
-                            break
-                            
-                        line_text = line.strip()
-                        self.monitoring_widget.append(f"[TSDuck] {line_text}")
-                        
-                        # Detect SCTE-35 markers in stream
-                        if any(keyword in line_text.lower() for keyword in ['splice', 'scte', 'cue', 'break', 'ad break']):
-                            self.monitoring_widget.scte35_markers_detected += 1
-                            self.monitoring_widget.last_scte35_detection = line_text
-                            self.monitoring_widget.update_scte35_status()
-
-                    # Process finished
-                    process.wait()
-                    exit_code = process.returncode
-                    self.processor = None
-                    
-                    if not self.streaming_active:
-                        # User stopped manually
-                        self.monitoring_widget.append("[INFO] Stream stopped by user")
-                        break
-                    
-                    # Stream stopped unexpectedly - reconnect
-                    self.retry_count += 1
-                    
-                    if exit_code == 0:
-                        self.monitoring_widget.append(f"[WARNING] Stream disconnected (exit code: {exit_code}). Reconnecting in 5 seconds...")
-                    else:
-                        self.monitoring_widget.append(f"[WARNING] Stream error (exit code: {exit_code}). Reconnecting in 5 seconds...")
-                    
-                    # Wait before reconnecting (with exponential backoff, max 30 seconds)
-                    wait_time = min(5 * min(self.retry_count, 6), 30)
-                    for i in range(wait_time):
-                        if not self.streaming_active:
-                            break
-                        time.sleep(1)
-                    
-                except Exception as e:
-                    self.monitoring_widget.append(f"[ERROR] Stream error: {e}")
-                    if not self.streaming_active:
-                        break
-                    
-                    # Wait before retry
-                    self.retry_count += 1
-                    wait_time = min(5 * min(self.retry_count, 6), 30)
-                    self.monitoring_widget.append(f"[INFO] Retrying in {wait_time} seconds...")
-                    for i in range(wait_time):
-                        if not self.streaming_active:
-                            break
-                        time.sleep(1)
-        
-        # Run in background thread
-        thread = threading.Thread(target=run_tsp_continuous, daemon=True)
-        thread.start()
+        # Run TSDuck with auto-reconnect on a worker thread; its output is
+        # delivered to the GUI thread through queued signals. A previous
+        # reader is stopped first so two never run at once.
+        self._stop_tsduck_reader()
+        self.tsduck_reader = TsduckReader(command, self._owned_processes)
+        self.tsduck_reader.line_received.connect(self.monitoring_widget.append_tsduck, Qt.ConnectionType.DirectConnection)
+        self.tsduck_reader.message.connect(self._on_tsduck_message, Qt.ConnectionType.QueuedConnection)
+        self.tsduck_reader.finished_with_code.connect(self._on_tsduck_exit, Qt.ConnectionType.QueuedConnection)
+        self.tsduck_reader.start()
         
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
     
+    def _on_tsduck_message(self, text):
+        """Show a reader status line after the output that preceded it"""
+        # The reader queued its earlier lines before emitting, so the shared
+        # console buffer keeps them in order
+        self.monitoring_widget.append(text)
+    
+    def _on_tsduck_exit(self, exit_code):
+        """Report an unexpected TSDuck exit before the reader reconnects"""
+        if exit_code == 0:
+            self.monitoring_widget.append(f"[WARNING] Stream disconnected (exit code: {exit_code}). Reconnecting in 5 seconds...")
+        else:
+            self.monitoring_widget.append(f"[WARNING] Stream error (exit code: {exit_code}). Reconnecting in 5 seconds...")
+    
+    def _kill_owned_processes(self):
+        """Kill TSDuck processes started by this window; returns how many were signalled"""
+        killed = 0
+        for process in list(self._owned_processes):
+            # Only signal a child that has not been reaped yet; a bare PID
+            # could already belong to an unrelated process
+            if process.poll() is None:
+                try:
+                    process.terminate()
+                    killed += 1
+                except OSError:
+                    pass
+            self._owned_processes.discard(process)
+        return killed
+    
     def stop_processing(self):
         """Stop TSDuck processing"""
         # Set flag to stop continuous streaming
         self.streaming_active = False
         
-        if self.processor:
-            self.monitoring_widget.append("[INFO] Stopping TSDuck process...")
-            try:
-                self.processor.terminate()
-                self.processor.wait(timeout=5)
-            except:
+        reader = self.tsduck_reader
+        if reader:
+            reader.stop()
+            process = reader.process
+            if process:
+                self.monitoring_widget.append("[INFO] Stopping TSDuck process...")
                 try:
-                    self.processor.kill()
+                    process.terminate()
+                    process.wait(timeout=5)
                 except:
-                    pass
-            finally:
-                self.processor = None
+                    try:
+                        process.kill()
+                    except:
+                        pass
+                finally:
+                    reader.process = None
         
-        # Kill all TSDuck processes to ensure clean shutdown
-        self.monitoring_widget.append("[INFO] Force killing all TSDuck processes...")
-        killed = kill_all_tsduck_processes()
+        # Kill any TSDuck process we started that is still running
+        killed = self._kill_owned_processes()
         if killed > 0:
             self.monitoring_widget.append(f"[INFO] Terminated {killed} TSDuck process(es)")
         
-        # Reset retry count
-        self.retry_count = 0
         self.monitoring_widget.append("[INFO] Processing stopped.")
         
         self.start_btn.setEnabled(True)
@@ -2049,6 +2543,9 @@ class MainWindow(QMainWindow):
 
 def main():
     app = QApplication(sys.argv)
+    app.setStyleSheet(APP_STYLESHEET)
+    # Scale the header logo during startup rather than in the first window
+    load_logo_pixmap()
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
@@ -5,8 +5,9 @@ Enterprise-grade broadcast encoder with modular architecture
 """
 
 import sys
-import os
+import importlib
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add src to path - handle both development and PyInstaller bundled modes
 if getattr(sys, 'frozen', False):
@@ -25,26 +26,123 @@ else:
     sys.path.insert(0, str(project_root))
     sys.path.insert(0, str(project_root / "src"))
 
-# Set UTF-8 encoding for Windows
-os.system('chcp 65001 >nul 2>&1')
+# Set UTF-8 encoding for Windows console (without spawning cmd.exe for chcp)
+if sys.platform == "win32":
+    try:
+        import ctypes
+        ctypes.windll.kernel32.SetConsoleOutputCP(65001)
+    except Exception:
+        pass
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.reconfigure(encoding='utf-8', errors='replace')
+        except Exception:
+            pass
+
+from PyQt6.QtCore import QTimer
 
 from src.core import Application, ConfigManager, get_logger
-# Direct imports to avoid PyInstaller issues with __init__.py
-from src.services.tsduck_service import TSDuckService
-from src.services.stream_service import StreamService
-from src.services.scte35_service import SCTE35Service
-from src.services.scte35_monitor_service import SCTE35MonitorService
+# Direct imports to avoid PyInstaller issues with __init__.py; only the
+# services needed before anything can fail are imported eagerly
 from src.services.telegram_service import TelegramService
-from src.services.monitoring_service import MonitoringService
-from src.services.profile_service import ProfileService
-from src.services.stream_analyzer_service import StreamAnalyzerService
-from src.services.bitrate_monitor_service import BitrateMonitorService
-from src.services.epg_service import EPGService
-from src.database import Database, SessionRepository
-from src.api import APIServer, setup_routes
 from src.ui.main_window import MainWindow
 from src.utils.crash_handler import CrashHandler
 
+# Lazily created services: name -> (module, class). Each module is imported
+# the first time its service is requested from the application framework.
+SERVICE_SPECS = {
+    "database": ("src.database", "Database"),
+    "session_repo": ("src.database", "SessionRepository"),
+    "tsduck": ("src.services.tsduck_service", "TSDuckService"),
+    "stream": ("src.services.stream_service", "StreamService"),
+    "scte35": ("src.services.scte35_service", "SCTE35Service"),
+    "scte35_monitor": ("src.services.scte35_monitor_service", "SCTE35MonitorService"),
+    "monitoring": ("src.services.monitoring_service", "MonitoringService"),
+    "profile": ("src.services.profile_service", "ProfileService"),
+    "stream_analyzer": ("src.services.stream_analyzer_service", "StreamAnalyzerService"),
+    "bitrate_monitor": ("src.services.bitrate_monitor_service", "BitrateMonitorService"),
+    "epg": ("src.services.epg_service", "EPGService"),
+    "backup": ("src.utils.backup_manager", "BackupManager"),
+}
+
+if TYPE_CHECKING:
+    # Never executed; keeps the lazily imported modules visible to
+    # PyInstaller's import analysis
+    import src.database
+    import src.services.tsduck_service
+    import src.services.stream_service
+    import src.services.scte35_service
+    import src.services.scte35_monitor_service
+    import src.services.monitoring_service
+    import src.services.profile_service
+    import src.services.stream_analyzer_service
+    import src.services.bitrate_monitor_service
+    import src.services.epg_service
+    import src.utils.backup_manager
+    import src.api
+
+
+def _service_class(name):
+    """Import and return the class for a SERVICE_SPECS entry"""
+    module_name, class_name = SERVICE_SPECS[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def register_lazy_services(app_framework, telegram_service, logger):
+    """Register every SERVICE_SPECS service to be created on first use"""
+    config = app_framework.config
+    get = app_framework.get_service
+    
+    def create_backup():
+        backup_manager = _service_class("backup")(max_backups=10)
+        logger.info("Backup manager initialized")
+        return backup_manager
+    
+    factories = {
+        "database": lambda: _service_class("database")(),
+        "session_repo": lambda: _service_class("session_repo")(get("database")),
+        # The installation check runs after the window is shown (_init_stage2)
+        "tsduck": lambda: _service_class("tsduck")(config.tsduck_path or None),
+        "stream": lambda: _service_class("stream")(get("tsduck"), telegram_service),
+        "scte35": lambda: _service_class("scte35")(),
+        "scte35_monitor": lambda: _service_class("scte35_monitor")(get("tsduck"), telegram_service),
+        "monitoring": lambda: _service_class("monitoring")(),
+        "profile": lambda: _service_class("profile")(),
+        "stream_analyzer": lambda: _service_class("stream_analyzer")(get("tsduck"), telegram_service),
+        "bitrate_monitor": lambda: _service_class("bitrate_monitor")(get("tsduck"), telegram_service),
+        "epg": lambda: _service_class("epg")(),
+        "backup": create_backup,
+    }
+    for name, factory in factories.items():
+        app_framework.register_lazy_service(name, factory)
+
+
+def _init_stage2(app_framework, logger):
+    """Post-show startup: verify TSDuck and create the backup manager"""
+    try:
+        if not app_framework.get_service("tsduck").verify_installation():
+            logger.warning("TSDuck installation not verified. Some features may not work.")
+        app_framework.get_service("backup")
+    except Exception as e:
+        logger.error(f"Deferred service initialization failed: {e}")
+
+
+def _init_stage3(app_framework, logger):
+    """Post-show startup: start the API server (if enabled)"""
+    config = app_framework.config
+    try:
+        if config.api_enabled:
+            from src.api import APIServer, setup_routes
+            api_server = APIServer(config.api_host, config.api_port)
+            setup_routes(api_server, app_framework)
+            api_server.start()
+            app_framework.register_service("api", api_server)
+            logger.info(f"API server started on http://{config.api_host}:{config.api_port}")
+    except Exception as e:
+        logger.error(f"Failed to start API server: {e}")
+    
+    logger.info("Services initialized")
+
 
 def main():
     """Main application entry point"""
@@ -69,19 +167,6 @@ def main():
         # Initialize services
         config = app_framework.config
         
-        # TSDuck service
-        tsduck_service = TSDuckService(config.tsduck_path or None)
-        if not tsduck_service.verify_installation():
-            logger.warning("TSDuck installation not verified. Some features may not work.")
-        
-        # Database
-        database = Database()
-        session_repo = SessionRepository(database)
-        app_framework.register_service("database", database)
-        app_framework.register_service("session_repo", session_repo)
-        
-        # Register services
-        app_framework.register_service("tsduck", tsduck_service)
         # Telegram Service (initialize early for crash alerts and stream notifications)
         telegram_service = TelegramService(
             bot_token=config.telegram_bot_token if config.telegram_enabled else "",
@@ -89,52 +174,22 @@ def main():
         )
         app_framework.register_service("telegram", telegram_service)
         
-        stream_service = StreamService(tsduck_service, telegram_service)  # Pass telegram service
-        app_framework.register_service("stream", stream_service)
-        app_framework.register_service("scte35", SCTE35Service())
-        
         # Crash Handler (with Telegram integration) - setup early
         crash_handler = CrashHandler(telegram_service)
         app_framework.set_crash_handler(crash_handler)
         
-        # SCTE-35 Monitor Service (requires TSDuck service)
-        scte35_monitor_service = SCTE35MonitorService(tsduck_service, telegram_service)
-        app_framework.register_service("scte35_monitor", scte35_monitor_service)
-        
-        app_framework.register_service("monitoring", MonitoringService())
-        app_framework.register_service("profile", ProfileService())
-        
-        # Stream Analysis Services (with Telegram integration)
-        stream_analyzer = StreamAnalyzerService(tsduck_service, telegram_service)
-        app_framework.register_service("stream_analyzer", stream_analyzer)
-        
-        bitrate_monitor = BitrateMonitorService(tsduck_service, telegram_service)
-        app_framework.register_service("bitrate_monitor", bitrate_monitor)
-        
-        # EPG Service
-        epg_service = EPGService()
-        app_framework.register_service("epg", epg_service)
-        
-        # Backup Manager (for automated backups)
-        from src.utils.backup_manager import BackupManager
-        backup_manager = BackupManager(max_backups=10)
-        app_framework.register_service("backup", backup_manager)
-        logger.info("Backup manager initialized")
-        
-        # API Server (if enabled)
-        if config.api_enabled:
-            api_server = APIServer(config.api_host, config.api_port)
-            setup_routes(api_server, app_framework)
-            api_server.start()
-            app_framework.register_service("api", api_server)
-            logger.info(f"API server started on http://{config.api_host}:{config.api_port}")
-        
-        logger.info("Services initialized")
+        # Remaining services are imported and created on first use
+        register_lazy_services(app_framework, telegram_service, logger)
         
         # Create and show main window
         main_window = MainWindow(app_framework)
         main_window.show()
         
+        # Non-critical startup work runs in the first event loop ticks after
+        # the window is shown
+        QTimer.singleShot(0, lambda: _init_stage2(app_framework, logger))
+        QTimer.singleShot(50, lambda: _init_stage3(app_framework, logger))
+        
         logger.info("Application ready")
         
         # Run application
@@ -5,8 +5,9 @@ Manages application lifecycle, dependency injection, and service coordination
 
 import sys
 import signal
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QObject, pyqtSignal
 
@@ -41,6 +42,9 @@ class Application(QObject):
         # Application state
         self._qt_app: Optional[QApplication] = None
         self._services = {}
+        # Factories for services created on first get_service() call
+        self._service_factories = {}
+        self._service_lock = threading.RLock()
         self._running = False
         self._crash_handler: Optional['CrashHandler'] = None
         
@@ -68,11 +72,30 @@ class Application(QObject):
     def register_service(self, name: str, service: object):
         """Register a service"""
         self._services[name] = service
+        self._service_factories.pop(name, None)
         self.logger.debug(f"Registered service: {name}")
     
+    def register_lazy_service(self, name: str, factory: Callable[[], object]):
+        """Register a service that is created by factory on first use"""
+        self._service_factories[name] = factory
+        self.logger.debug(f"Registered lazy service: {name}")
+    
+    def has_service(self, name: str) -> bool:
+        """Check if a service is registered (created or not)"""
+        return name in self._services or name in self._service_factories
+    
     def get_service(self, name: str) -> Optional[object]:
-        """Get a registered service"""
-        return self._services.get(name)
+        """Get a registered service, creating a lazy one on first access"""
+        service = self._services.get(name)
+        if service is not None:
+            return service
+        
+        with self._service_lock:
+            if name in self._service_factories and name not in self._services:
+                self._services[name] = self._service_factories[name]()
+                del self._service_factories[name]
+                self.logger.debug(f"Created lazy service: {name}")
+            return self._services.get(name)
     
     def initialize_qt(self):
         """Initialize Qt application"""
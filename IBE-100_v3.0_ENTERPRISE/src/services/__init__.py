@@ -2,61 +2,62 @@
 Business logic services
 """
 
-# Direct imports - PyInstaller should handle these correctly
-try:
-    from .tsduck_service import TSDuckService
-except ImportError:
-    TSDuckService = None
+import importlib
+from typing import TYPE_CHECKING
 
-try:
+# Services are resolved lazily on first attribute access (PEP 562) so that
+# importing the package does not pull in every service's dependencies.
+# The TYPE_CHECKING imports keep the submodules visible to PyInstaller's
+# import analysis and to type checkers.
+if TYPE_CHECKING:
+    from .tsduck_service import TSDuckService
     from .stream_service import StreamService
-except ImportError:
-    StreamService = None
-
-try:
     from .scte35_service import SCTE35Service
-except ImportError:
-    SCTE35Service = None
-
-try:
     from .scte35_monitor_service import SCTE35MonitorService
-except ImportError:
-    SCTE35MonitorService = None
-
-try:
     from .telegram_service import TelegramService
-except ImportError:
-    TelegramService = None
-
-try:
     from .monitoring_service import MonitoringService
-except ImportError:
-    MonitoringService = None
-
-try:
     from .profile_service import ProfileService
-except ImportError:
-    ProfileService = None
-
-try:
     from .stream_analyzer_service import StreamAnalyzerService, StreamMetrics, ComplianceReport
-except ImportError:
-    StreamAnalyzerService = None
-    StreamMetrics = None
-    ComplianceReport = None
-
-try:
     from .bitrate_monitor_service import BitrateMonitorService, BitratePoint
-except ImportError:
-    BitrateMonitorService = None
-    BitratePoint = None
-
-try:
     from .epg_service import EPGService, EPGEvent, EPGServiceInfo
-except ImportError:
-    EPGService = None
-    EPGEvent = None
-    EPGServiceInfo = None
+
+_LAZY_ATTRS = {
+    'TSDuckService': '.tsduck_service',
+    'StreamService': '.stream_service',
+    'SCTE35Service': '.scte35_service',
+    'SCTE35MonitorService': '.scte35_monitor_service',
+    'TelegramService': '.telegram_service',
+    'MonitoringService': '.monitoring_service',
+    'ProfileService': '.profile_service',
+    'StreamAnalyzerService': '.stream_analyzer_service',
+    'StreamMetrics': '.stream_analyzer_service',
+    'ComplianceReport': '.stream_analyzer_service',
+    'BitrateMonitorService': '.bitrate_monitor_service',
+    'BitratePoint': '.bitrate_monitor_service',
+    'EPGService': '.epg_service',
+    'EPGEvent': '.epg_service',
+    'EPGServiceInfo': '.epg_service',
+}
+
+
+def __getattr__(name):
+    """Import a service on first access; unavailable services resolve to None"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except ImportError:
+        value = None
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
+
 
 __all__ = [
     'TSDuckService',
@@ -75,4 +76,3 @@ __all__ = [
     'EPGEvent',
     'EPGServiceInfo'
 ]
-
@@ -2,14 +2,47 @@
 UI Widgets for Enterprise Interface
 """
 
-from .stream_config_widget import StreamConfigWidget
-from .scte35_widget import SCTE35Widget
-from .monitoring_widget import MonitoringWidget
-from .dashboard_widget import DashboardWidget
-from .scte35_monitor_widget import SCTE35MonitorWidget
-from .stream_quality_widget import StreamQualityWidget
-from .bitrate_monitor_widget import BitrateMonitorWidget
-from .epg_editor_widget import EPGEditorWidget
+import importlib
+from typing import TYPE_CHECKING
+
+# Widgets are resolved lazily on first attribute access (PEP 562); see
+# src/services/__init__.py for why the TYPE_CHECKING imports are kept.
+if TYPE_CHECKING:
+    from .stream_config_widget import StreamConfigWidget
+    from .scte35_widget import SCTE35Widget
+    from .monitoring_widget import MonitoringWidget
+    from .dashboard_widget import DashboardWidget
+    from .scte35_monitor_widget import SCTE35MonitorWidget
+    from .stream_quality_widget import StreamQualityWidget
+    from .bitrate_monitor_widget import BitrateMonitorWidget
+    from .epg_editor_widget import EPGEditorWidget
+
+_LAZY_ATTRS = {
+    'StreamConfigWidget': '.stream_config_widget',
+    'SCTE35Widget': '.scte35_widget',
+    'MonitoringWidget': '.monitoring_widget',
+    'DashboardWidget': '.dashboard_widget',
+    'SCTE35MonitorWidget': '.scte35_monitor_widget',
+    'StreamQualityWidget': '.stream_quality_widget',
+    'BitrateMonitorWidget': '.bitrate_monitor_widget',
+    'EPGEditorWidget': '.epg_editor_widget',
+}
+
+
+def __getattr__(name):
+    """Import a widget module on first access"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
+
 
 __all__ = [
     'StreamConfigWidget',
@@ -21,4 +54,3 @@ __all__ = [
     'BitrateMonitorWidget',
     'EPGEditorWidget'
 ]
-
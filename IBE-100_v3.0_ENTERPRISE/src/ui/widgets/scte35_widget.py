@@ -19,9 +19,25 @@ class SCTE35Widget(QWidget):
     
     marker_generated = pyqtSignal(SCTE35Marker)
     
+    # Button styles, dispatched by object name so Qt parses them once
+    BUTTON_STYLESHEET = """
+        QPushButton#primaryBtn, QPushButton#infoBtn {
+            color: white;
+            font-weight: bold;
+            padding: 12px;
+            font-size: 14px;
+            border-radius: 8px;
+        }
+        QPushButton#primaryBtn { background-color: #4CAF50; }
+        QPushButton#primaryBtn:hover { background-color: #45a049; }
+        QPushButton#infoBtn { background-color: #2196F3; }
+        QPushButton#infoBtn:hover { background-color: #1976D2; }
+    """
+    
     def __init__(self, scte35_service):
         super().__init__()
         self.scte35_service = scte35_service
+        self.setStyleSheet(self.BUTTON_STYLESHEET)
         self.setup_ui()
         self._update_directory_display()
         # Initialize auto-increment state
@@ -132,36 +148,12 @@ class SCTE35Widget(QWidget):
         button_layout = QHBoxLayout()
         
         self.generate_btn = QPushButton("🎯 Generate Marker")
-        self.generate_btn.setStyleSheet("""
-            QPushButton { 
-                background-color: #4CAF50; 
-                color: white; 
-                font-weight: bold; 
-                padding: 12px; 
-                font-size: 14px;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        self.generate_btn.setObjectName("primaryBtn")
         self.generate_btn.clicked.connect(self._generate_marker)
         button_layout.addWidget(self.generate_btn)
         
         self.generate_pair_btn = QPushButton("🎬 Generate CUE Pair")
-        self.generate_pair_btn.setStyleSheet("""
-            QPushButton { 
-                background-color: #2196F3; 
-                color: white; 
-                font-weight: bold; 
-                padding: 12px; 
-                font-size: 14px;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-        """)
+        self.generate_pair_btn.setObjectName("infoBtn")
         self.generate_pair_btn.setToolTip("Generate CUE-OUT and CUE-IN with sequential event IDs")
         self.generate_pair_btn.clicked.connect(self._generate_cue_pair)
         button_layout.addWidget(self.generate_pair_btn)
@@ -231,17 +223,22 @@ class SCTE35Widget(QWidget):
                 if cue_crash:
                     self.marker_generated.emit(cue_crash)
                 
+                # Resolve file names once for the summary dialog
+                out_name = cue_out.xml_path.name
+                in_name = cue_in.xml_path.name
+                crash_name = cue_crash.xml_path.name
+                
                 QMessageBox.information(
                     self, "Success",
                     f"Preroll sequence generated successfully!\n\n"
                     f"CUE-OUT:\n"
-                    f"  File: {cue_out.xml_path.name}\n"
+                    f"  File: {out_name}\n"
                     f"  Event ID: {cue_out.event_id}\n\n"
                     f"CUE-IN:\n"
-                    f"  File: {cue_in.xml_path.name}\n"
+                    f"  File: {in_name}\n"
                     f"  Event ID: {cue_in.event_id}\n\n"
                     f"CUE-CRASH:\n"
-                    f"  File: {cue_crash.xml_path.name}\n"
+                    f"  File: {crash_name}\n"
                     f"  Event ID: {cue_crash.event_id}\n\n"
                     f"Ad Duration: {ad_duration} seconds"
                 )
@@ -296,14 +293,17 @@ class SCTE35Widget(QWidget):
             self.marker_generated.emit(cue_out)
             self.marker_generated.emit(cue_in)
             
+            out_name = cue_out.xml_path.name
+            in_name = cue_in.xml_path.name
+            
             QMessageBox.information(
                 self, "Success",
                 f"CUE pair generated successfully!\n\n"
                 f"CUE-OUT:\n"
-                f"  File: {cue_out.xml_path.name}\n"
+                f"  File: {out_name}\n"
                 f"  Event ID: {cue_out.event_id}\n\n"
                 f"CUE-IN:\n"
-                f"  File: {cue_in.xml_path.name}\n"
+                f"  File: {in_name}\n"
                 f"  Event ID: {cue_in.event_id}\n\n"
                 f"Ad Duration: {ad_duration} seconds"
             )
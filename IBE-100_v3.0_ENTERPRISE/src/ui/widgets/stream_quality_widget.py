@@ -63,9 +63,30 @@ class StreamQualityWidget(QWidget):
     metrics_updated = pyqtSignal(object)  # Emits StreamMetrics
     compliance_changed = pyqtSignal(object)  # Emits ComplianceReport
     
+    # Button styles, dispatched by object name so Qt parses them once
+    BUTTON_STYLESHEET = """
+        QPushButton#primaryBtn, QPushButton#dangerBtn, QPushButton#warnBtn {
+            color: white;
+            font-weight: bold;
+            padding: 8px 15px;
+            border-radius: 5px;
+        }
+        QPushButton#primaryBtn { background-color: #4CAF50; }
+        QPushButton#primaryBtn:hover { background-color: #45a049; }
+        QPushButton#dangerBtn { background-color: #f44336; }
+        QPushButton#dangerBtn:hover { background-color: #da190b; }
+        QPushButton#warnBtn { background-color: #FF9800; }
+        QPushButton#warnBtn:hover { background-color: #F57C00; }
+        QPushButton#primaryBtn:disabled, QPushButton#dangerBtn:disabled {
+            background-color: #666;
+        }
+    """
+    
     def __init__(self, analyzer_service: Optional[StreamAnalyzerService] = None):
         super().__init__()
         self.analyzer_service = analyzer_service
+        self._analysis_running = False
+        self.setStyleSheet(self.BUTTON_STYLESHEET)
         self.setup_ui()
         self.setup_timers()
         
@@ -128,57 +149,18 @@ class StreamQualityWidget(QWidget):
         button_layout = QHBoxLayout()
         
         self.start_btn = QPushButton("▶️ Start Analysis")
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                font-weight: bold;
-                padding: 8px 15px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #666;
-            }
-        """)
+        self.start_btn.setObjectName("primaryBtn")
         self.start_btn.clicked.connect(self._start_analysis)
         button_layout.addWidget(self.start_btn)
         
         self.stop_btn = QPushButton("⏹️ Stop")
-        self.stop_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                font-weight: bold;
-                padding: 8px 15px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-            QPushButton:disabled {
-                background-color: #666;
-            }
-        """)
+        self.stop_btn.setObjectName("dangerBtn")
         self.stop_btn.setEnabled(False)
         self.stop_btn.clicked.connect(self._stop_analysis)
         button_layout.addWidget(self.stop_btn)
         
         self.clear_btn = QPushButton("🗑️ Clear History")
-        self.clear_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FF9800;
-                color: white;
-                font-weight: bold;
-                padding: 8px 15px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #F57C00;
-            }
-        """)
+        self.clear_btn.setObjectName("warnBtn")
         self.clear_btn.clicked.connect(self._clear_history)
         button_layout.addWidget(self.clear_btn)
         
@@ -354,6 +336,7 @@ class StreamQualityWidget(QWidget):
         )
         
         if success:
+            self._analysis_running = True
             self.start_btn.setEnabled(False)
             self.stop_btn.setEnabled(True)
             self.input_source.setEnabled(False)
@@ -367,6 +350,7 @@ class StreamQualityWidget(QWidget):
             self.analyzer_service.stop_analysis()
             self.log_console.append("[INFO] Analysis stopped")
         
+        self._analysis_running = False
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.input_source.setEnabled(True)
@@ -433,7 +417,7 @@ class StreamQualityWidget(QWidget):
     
     def _update_display(self):
         """Update metrics display"""
-        if not self.analyzer_service:
+        if not self.analyzer_service or not self._analysis_running:
             return
         
         metrics = self.analyzer_service.get_current_metrics()
@@ -2,16 +2,34 @@
 Automated backup manager for database and configuration
 """
 
+import os
 import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Tuple
 from ..core.logger import get_logger
 
 
 class BackupManager:
     """Manages automated backups of database and configuration"""
     
+    # ioctl request number for a copy-on-write clone (Btrfs, XFS reflink)
+    FICLONE = 0x40049409
+    
+    # Block size for buffered copies when no zero-copy path is available
+    COPY_BUFSIZE = 8 * 1024 * 1024
+    
+    # Timestamp embedded in backup file and directory names
+    TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+    
+    # A listing taken this soon after the directory changed is not reused,
+    # since a second change within the mtime granularity would go unseen
+    # (seconds; FAT/exFAT record mtimes in 2 s steps)
+    SCAN_RACY_WINDOW = 2.0
+    
     def __init__(self, backup_dir: Path = None, max_backups: int = 10):
         """
         Initialize backup manager
@@ -24,43 +42,59 @@ class BackupManager:
         self.backup_dir = backup_dir or Path("backups")
         self.backup_dir.mkdir(exist_ok=True)
         self.max_backups = max_backups
+        
+        # (directory st_mtime_ns, [(mtime, name, is_file), ...]) from the last scan
+        self._entries_cache: Optional[Tuple[int, List[Tuple[float, str, bool]]]] = None
     
-    def backup_database(self, db_path: Path) -> Optional[Path]:
+    def backup_database(self, db_path: Path, timestamp: Optional[str] = None) -> Optional[Path]:
         """
         Backup database file
         
         Args:
             db_path: Path to database file
+            timestamp: Backup timestamp (defaults to now)
         
         Returns:
             Path to backup file, or None if backup failed
         """
-        if not db_path or not db_path.exists():
+        if not db_path:
             self.logger.warning(f"Database file not found: {db_path}")
             return None
         
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = timestamp or time.strftime(self.TIMESTAMP_FORMAT)
             backup_filename = f"database_{timestamp}.db"
             backup_path = self.backup_dir / backup_filename
             
-            shutil.copy2(db_path, backup_path)
+            self._clone_file(db_path, backup_path)
             self.logger.info(f"Database backed up to: {backup_path}")
             
             # Cleanup old backups
             self._cleanup_old_backups("database_")
             
             return backup_path
+        except FileNotFoundError:
+            self.logger.warning(f"Database file not found: {db_path}")
+            return None
         except Exception as e:
             self.logger.error(f"Failed to backup database: {e}")
             return None
     
-    def backup_config(self, config_dir: Path) -> Optional[Path]:
+    def backup_config(
+        self,
+        config_dir: Path,
+        timestamp: Optional[str] = None,
+        link: bool = False
+    ) -> Optional[Path]:
         """
         Backup configuration directory
         
         Args:
             config_dir: Path to configuration directory
+            timestamp: Backup timestamp (defaults to now)
+            link: Snapshot with hard links instead of copying file data.
+                Only safe if the application replaces files rather than
+                rewriting them in place, since links share file contents.
         
         Returns:
             Path to backup directory, or None if backup failed
@@ -70,11 +104,11 @@ class BackupManager:
             return None
         
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = timestamp or time.strftime(self.TIMESTAMP_FORMAT)
             backup_dirname = f"config_{timestamp}"
             backup_path = self.backup_dir / backup_dirname
             
-            shutil.copytree(config_dir, backup_path, dirs_exist_ok=True)
+            self._fast_copytree(config_dir, backup_path, link=link)
             self.logger.info(f"Configuration backed up to: {backup_path}")
             
             # Cleanup old backups
@@ -85,12 +119,20 @@ class BackupManager:
             self.logger.error(f"Failed to backup configuration: {e}")
             return None
     
-    def backup_profiles(self, profiles_dir: Path) -> Optional[Path]:
+    def backup_profiles(
+        self,
+        profiles_dir: Path,
+        timestamp: Optional[str] = None,
+        link: bool = False
+    ) -> Optional[Path]:
         """
         Backup profiles directory
         
         Args:
             profiles_dir: Path to profiles directory
+            timestamp: Backup timestamp (defaults to now)
+            link: Snapshot with hard links instead of copying file data
+                (see backup_config)
         
         Returns:
             Path to backup directory, or None if backup failed
@@ -100,11 +142,11 @@ class BackupManager:
             return None
         
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = timestamp or time.strftime(self.TIMESTAMP_FORMAT)
             backup_dirname = f"profiles_{timestamp}"
             backup_path = self.backup_dir / backup_dirname
             
-            shutil.copytree(profiles_dir, backup_path, dirs_exist_ok=True)
+            self._fast_copytree(profiles_dir, backup_path, link=link)
             self.logger.info(f"Profiles backed up to: {backup_path}")
             
             # Cleanup old backups
@@ -115,7 +157,13 @@ class BackupManager:
             self.logger.error(f"Failed to backup profiles: {e}")
             return None
     
-    def create_full_backup(self, db_path: Path, config_dir: Path, profiles_dir: Path) -> Optional[Path]:
+    def create_full_backup(
+        self,
+        db_path: Path,
+        config_dir: Path,
+        profiles_dir: Path,
+        timestamp: Optional[str] = None
+    ) -> Optional[Path]:
         """
         Create full backup of all data
         
@@ -123,27 +171,42 @@ class BackupManager:
             db_path: Path to database file
             config_dir: Path to configuration directory
             profiles_dir: Path to profiles directory
+            timestamp: Backup timestamp (defaults to now)
         
         Returns:
             Path to backup directory, or None if backup failed
         """
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = timestamp or time.strftime(self.TIMESTAMP_FORMAT)
             backup_dirname = f"full_backup_{timestamp}"
             backup_path = self.backup_dir / backup_dirname
             backup_path.mkdir(exist_ok=True)
             
-            # Backup database
-            if db_path and db_path.exists():
-                shutil.copy2(db_path, backup_path / "database.db")
-            
-            # Backup config
-            if config_dir and config_dir.exists():
-                shutil.copytree(config_dir, backup_path / "config", dirs_exist_ok=True)
+            # The three copies touch independent trees, so run them concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = {}
+                
+                # Backup database
+                if db_path and db_path.exists():
+                    futures[executor.submit(self._clone_file, db_path, backup_path / "database.db")] = "database"
+                
+                # Backup config
+                if config_dir and config_dir.exists():
+                    futures[executor.submit(self._fast_copytree, config_dir, backup_path / "config")] = "config"
+                
+                # Backup profiles
+                if profiles_dir and profiles_dir.exists():
+                    futures[executor.submit(self._fast_copytree, profiles_dir, backup_path / "profiles")] = "profiles"
+                
+                errors = []
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        errors.append(f"{futures[future]}: {e}")
             
-            # Backup profiles
-            if profiles_dir and profiles_dir.exists():
-                shutil.copytree(profiles_dir, backup_path / "profiles", dirs_exist_ok=True)
+            if errors:
+                raise RuntimeError("; ".join(errors))
             
             self.logger.info(f"Full backup created at: {backup_path}")
             
@@ -155,25 +218,231 @@ class BackupManager:
             self.logger.error(f"Failed to create full backup: {e}")
             return None
     
-    def _cleanup_old_backups(self, prefix: str):
-        """Remove old backups, keeping only the most recent ones"""
+    def _clone_file(self, src: Path, dst: Path):
+        """
+        Copy a single file, preferring zero-copy clones where supported
+        
+        Tries a copy-on-write reflink (FICLONE on Linux, clonefile on macOS),
+        then an in-kernel os.copy_file_range loop, and finally a buffered copy
+        with COPY_BUFSIZE blocks. Metadata (mode and mtime) is preserved in
+        every case, and the copied pages are dropped from the page cache so a
+        large backup does not evict the live database's working set.
+        
+        Args:
+            src: Source file
+            dst: Destination file
+        """
+        if sys.platform == "darwin":
+            try:
+                import ctypes
+                libc = ctypes.CDLL("/usr/lib/libSystem.dylib", use_errno=True)
+                if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+                    shutil.copystat(src, dst)
+                    return
+            except (OSError, AttributeError):
+                pass
+        elif sys.platform.startswith("linux"):
+            try:
+                with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                    src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+                    try:
+                        import fcntl
+                        fcntl.ioctl(dst_fd, self.FICLONE, src_fd)
+                    except OSError:
+                        size = os.fstat(src_fd).st_size
+                        remaining = size
+                        while remaining > 0:
+                            copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                            if copied == 0:
+                                # Some filesystems stop early; both offsets
+                                # have advanced, so finish with a plain copy
+                                shutil.copyfileobj(fsrc, fdst, length=self.COPY_BUFSIZE)
+                                fdst.flush()
+                                break
+                            remaining -= copied
+                        if os.fstat(dst_fd).st_size != size:
+                            # Falls through to the full buffered copy below
+                            raise OSError(f"Short copy of {src}")
+                    self._drop_page_cache(src_fd, dst_fd)
+                shutil.copystat(src, dst)
+                return
+            except (OSError, AttributeError):
+                pass
+        
+        # Large blocks amortize syscall overhead on multi-GB databases
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            shutil.copyfileobj(fsrc, fdst, length=self.COPY_BUFSIZE)
+            fdst.flush()
+            self._drop_page_cache(fsrc.fileno(), fdst.fileno())
+        shutil.copystat(src, dst)
+    
+    def _drop_page_cache(self, src_fd: int, dst_fd: int):
+        """Advise the kernel that copied file pages will not be reused"""
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        try:
+            # Dirty pages are not dropped by DONTNEED, so write them out first
+            os.fdatasync(dst_fd)
+            os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            os.posix_fadvise(dst_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError as e:
+            self.logger.debug(f"Could not drop backup pages from cache: {e}")
+    
+    def _fast_copytree(self, src: Path, dst: Path, link: bool = False):
+        """
+        Copy a directory tree using the platform's native bulk copy tool
+        
+        Uses multithreaded robocopy on Windows and cp -a on Linux, which avoid
+        the per-file Python overhead of shutil.copytree on trees of many small
+        files. Falls back to shutil.copytree on other platforms or if the
+        native tool is unavailable or fails.
+        
+        Args:
+            src: Source directory
+            dst: Destination directory (created if missing)
+            link: Create a hard-link snapshot (cp -al on Linux, os.link
+                elsewhere) so unchanged files cost no data copy
+        """
+        dst.mkdir(parents=True, exist_ok=True)
+        
+        if link:
+            self._link_copytree(src, dst)
+            return
+        
         try:
-            backups = sorted(
-                [p for p in self.backup_dir.iterdir() if p.name.startswith(prefix)],
-                key=lambda p: p.stat().st_mtime,
+            if sys.platform == "win32":
+                result = subprocess.run(
+                    ["robocopy", str(src), str(dst), "/MT:64", "/E",
+                     "/NFL", "/NDL", "/NP", "/R:1", "/W:1"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+                )
+                # robocopy exit codes 0-7 indicate success; 8+ indicate failures
+                if result.returncode < 8:
+                    return
+            elif sys.platform.startswith("linux"):
+                result = subprocess.run(
+                    ["cp", "-a", f"{src}/.", str(dst)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+                if result.returncode == 0:
+                    return
+            else:
+                shutil.copytree(src, dst, dirs_exist_ok=True)
+                return
+            
+            self.logger.warning(
+                f"Native copy of {src} failed (exit code {result.returncode}), "
+                f"falling back to shutil"
+            )
+        except FileNotFoundError:
+            self.logger.debug("Native copy tool not found, falling back to shutil")
+        
+        shutil.copytree(src, dst, dirs_exist_ok=True)
+    
+    def _link_copytree(self, src: Path, dst: Path):
+        """
+        Snapshot a directory tree with hard links
+        
+        Files that cannot be linked (e.g. across filesystems) are copied.
+        
+        Args:
+            src: Source directory
+            dst: Destination directory (must exist)
+        """
+        if sys.platform.startswith("linux"):
+            try:
+                result = subprocess.run(
+                    ["cp", "-al", f"{src}/.", str(dst)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+                if result.returncode == 0:
+                    return
+            except FileNotFoundError:
+                pass
+        
+        for root, dirs, files in os.walk(src):
+            target_root = dst / os.path.relpath(root, src)
+            for name in dirs:
+                (target_root / name).mkdir(exist_ok=True)
+            for name in files:
+                source_file = os.path.join(root, name)
+                target_file = target_root / name
+                try:
+                    os.link(source_file, target_file)
+                except FileExistsError:
+                    pass
+                except OSError:
+                    shutil.copy2(source_file, target_file)
+    
+    def _scan_backup_dir(self, refresh: bool = False) -> List[Tuple[float, str, bool]]:
+        """
+        List backup directory entries, newest first
+        
+        A single scandir pass stats every entry once; the snapshot is reused
+        while the directory's mtime is unchanged, so any backup created or
+        removed (by this manager or anything else) forces a rescan.
+        
+        Args:
+            refresh: Ignore any cached snapshot (e.g. after writing a backup)
+        
+        Returns:
+            List of (mtime, name, is_file) tuples sorted by mtime descending
+        """
+        dir_mtime_ns = os.stat(self.backup_dir).st_mtime_ns
+        if not refresh and self._entries_cache and self._entries_cache[0] == dir_mtime_ns:
+            return self._entries_cache[1]
+        
+        with os.scandir(self.backup_dir) as it:
+            entries = sorted(
+                ((entry.stat().st_mtime, entry.name, entry.is_file()) for entry in it),
                 reverse=True
             )
+        
+        if time.time() - dir_mtime_ns / 1e9 >= self.SCAN_RACY_WINDOW:
+            self._entries_cache = (dir_mtime_ns, entries)
+        else:
+            self._entries_cache = None
+        return entries
+    
+    def _cleanup_old_backups(self, prefix: str):
+        """Remove old backups, keeping only the most recent ones"""
+        try:
+            # Called right after a backup was written, so always rescan
+            backups = [e for e in self._scan_backup_dir(refresh=True) if e[1].startswith(prefix)]
             
-            # Remove old backups
-            for backup in backups[self.max_backups:]:
-                try:
-                    if backup.is_file():
-                        backup.unlink()
-                    else:
-                        shutil.rmtree(backup)
-                    self.logger.debug(f"Removed old backup: {backup}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to remove old backup {backup}: {e}")
+            expired = backups[self.max_backups:]
+            if not expired:
+                return
+            
+            # Entries are about to be removed, so the snapshot goes stale
+            self._entries_cache = None
+            
+            # Unlink expired files relative to one open directory handle so
+            # each removal skips path resolution; fall back to full paths
+            dir_fd = None
+            if os.unlink in os.supports_dir_fd:
+                dir_fd = os.open(self.backup_dir, os.O_RDONLY)
+            try:
+                for _, name, is_file in expired:
+                    backup = self.backup_dir / name
+                    try:
+                        if is_file:
+                            if dir_fd is not None:
+                                os.unlink(name, dir_fd=dir_fd)
+                            else:
+                                os.unlink(backup)
+                        else:
+                            shutil.rmtree(backup)
+                        self.logger.debug(f"Removed old backup: {backup}")
+                    except Exception as e:
+                        self.logger.warning(f"Failed to remove old backup {backup}: {e}")
+            finally:
+                if dir_fd is not None:
+                    os.close(dir_fd)
         except Exception as e:
             self.logger.error(f"Failed to cleanup old backups: {e}")
     
@@ -188,14 +457,12 @@ class BackupManager:
             List of backup paths
         """
         try:
-            if backup_type:
-                prefix = f"{backup_type}_"
-                backups = [p for p in self.backup_dir.iterdir() if p.name.startswith(prefix)]
-            else:
-                backups = list(self.backup_dir.iterdir())
-            
-            return sorted(backups, key=lambda p: p.stat().st_mtime, reverse=True)
+            prefix = f"{backup_type}_" if backup_type else ""
+            return [
+                self.backup_dir / name
+                for _, name, _ in self._scan_backup_dir()
+                if name.startswith(prefix)
+            ]
         except Exception as e:
             self.logger.error(f"Failed to list backups: {e}")
             return []
-
@@ -2,16 +2,26 @@
 Helper utility functions
 """
 
+import functools
 import shutil
-import os
 from pathlib import Path
 from typing import Optional
 
 
+# Invalid filename characters for Windows/Linux, mapped to '_' in one pass
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+@functools.lru_cache(maxsize=1)
 def find_tsduck() -> str:
     """
     Find TSDuck installation path
     
+    The result is cached; call find_tsduck.cache_clear() after installing
+    or moving TSDuck to probe again.
+    
     Returns:
         Path to tsp.exe or 'tsp' if not found
     """
@@ -23,13 +33,9 @@ def find_tsduck() -> str:
     ]
     
     for path in paths:
-        if shutil.which(path) or os.path.exists(path):
-            if os.path.exists(path):
-                return path
-            else:
-                found = shutil.which(path)
-                if found:
-                    return found
+        found = shutil.which(path)
+        if found:
+            return found
     
     return "tsp"  # Fallback
 
@@ -47,20 +53,15 @@ def format_duration(seconds: float) -> str:
     if seconds < 60:
         return f"{int(seconds)}s"
     
-    minutes = int(seconds // 60)
-    secs = int(seconds % 60)
-    
+    minutes, secs = divmod(int(seconds), 60)
     if minutes < 60:
         return f"{minutes}m {secs}s"
     
-    hours = int(minutes // 60)
-    mins = int(minutes % 60)
-    
+    hours, mins = divmod(minutes, 60)
     if hours < 24:
         return f"{hours}h {mins}m {secs}s"
     
-    days = int(hours // 24)
-    hrs = int(hours % 24)
+    days, hrs = divmod(hours, 24)
     return f"{days}d {hrs}h {mins}m"
 
 
@@ -74,11 +75,9 @@ def format_bytes(bytes_count: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 MB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_count < 1024.0:
-            return f"{bytes_count:.2f} {unit}"
-        bytes_count /= 1024.0
-    return f"{bytes_count:.2f} PB"
+    # Each unit step is 2**10, so the unit index comes from the bit length
+    index = min((int(max(bytes_count, 1)).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_count / (1024 ** index):.2f} {_BYTE_UNITS[index]}"
 
 
 def sanitize_filename(filename: str) -> str:
@@ -92,9 +91,7 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Remove invalid characters for Windows/Linux
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
+    filename = filename.translate(_SANITIZE_TABLE)
     
     # Remove leading/trailing spaces and dots
     filename = filename.strip(' .')
@@ -5,11 +5,26 @@ Handles encryption and storage of profile-specific settings (Telegram, etc.)
 
 import json
 import os
+import re
+import threading
 from pathlib import Path
 from typing import Any, Dict, Optional
 from cryptography.fernet import Fernet
 from ..core.logger import get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Characters not allowed in profile config file names
+_UNSAFE_NAME_RE = re.compile(r'[^\w -]')
+
+# Ciphers shared by all managers using the same profiles directory
+_CIPHER_CACHE: Dict[Path, Fernet] = {}
+_CIPHER_LOCK = threading.Lock()
+
 
 class ProfileConfigManager:
     """Manages profile-specific configuration with encryption"""
@@ -26,27 +41,34 @@ class ProfileConfigManager:
         self.profiles_dir.mkdir(exist_ok=True)
         
         # Load or generate encryption key (shared across profiles)
-        self._key: Optional[bytes] = None
         self._cipher: Optional[Fernet] = None
         self._load_encryption_key()
     
     def _load_encryption_key(self):
         """Load or generate encryption key"""
-        key_file = self.profiles_dir / ".encryption_key"
+        cache_key = self.profiles_dir.resolve()
         
-        if key_file.exists():
-            with open(key_file, 'rb') as f:
-                self._key = f.read()
-        else:
-            # Generate new key
-            self._key = Fernet.generate_key()
-            with open(key_file, 'wb') as f:
-                f.write(self._key)
-            # Set restrictive permissions (Unix-like)
-            if hasattr(os, 'chmod'):
-                os.chmod(key_file, 0o600)
+        with _CIPHER_LOCK:
+            cipher = _CIPHER_CACHE.get(cache_key)
+            if cipher is None:
+                key_file = self.profiles_dir / ".encryption_key"
+                
+                try:
+                    with open(key_file, 'rb') as f:
+                        key = f.read()
+                except FileNotFoundError:
+                    # Generate new key
+                    key = Fernet.generate_key()
+                    with open(key_file, 'wb') as f:
+                        f.write(key)
+                    # Set restrictive permissions (Unix-like)
+                    if hasattr(os, 'chmod'):
+                        os.chmod(key_file, 0o600)
+                
+                cipher = Fernet(key)
+                _CIPHER_CACHE[cache_key] = cipher
         
-        self._cipher = Fernet(self._key)
+        self._cipher = cipher
     
     def encrypt(self, value: str) -> str:
         """Encrypt a string value"""
@@ -66,7 +88,7 @@ class ProfileConfigManager:
     def get_profile_config_path(self, profile_name: str) -> Path:
         """Get configuration file path for a profile"""
         # Sanitize profile name for filesystem
-        safe_name = "".join(c for c in profile_name if c.isalnum() or c in (' ', '-', '_')).strip()
+        safe_name = _UNSAFE_NAME_RE.sub('', profile_name).strip()
         safe_name = safe_name.replace(' ', '_')
         return self.profiles_dir / f"{safe_name}_config.json"
     
@@ -82,18 +104,19 @@ class ProfileConfigManager:
         """
         config_path = self.get_profile_config_path(profile_name)
         
-        if not config_path.exists():
-            return {}
-        
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Read raw bytes in one call; both parsers decode UTF-8 themselves
+            with open(config_path, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
             
             # Decrypt sensitive fields
             if 'telegram_bot_token' in data and data['telegram_bot_token']:
                 data['telegram_bot_token'] = self.decrypt(data['telegram_bot_token'])
             
             return data
+        except FileNotFoundError:
+            return {}
         except Exception as e:
             self.logger.error(f"Failed to load profile config for {profile_name}: {e}")
             return {}
@@ -109,13 +132,20 @@ class ProfileConfigManager:
         config_path = self.get_profile_config_path(profile_name)
         
         try:
-            # Encrypt sensitive fields
-            data = settings.copy()
-            if 'telegram_bot_token' in data and data['telegram_bot_token']:
-                data['telegram_bot_token'] = self.encrypt(data['telegram_bot_token'])
+            # Encrypt sensitive fields, copying only when there is one to replace
+            data = settings
+            if settings.get('telegram_bot_token'):
+                data = {**settings, 'telegram_bot_token': self.encrypt(settings['telegram_bot_token'])}
+            
+            if orjson:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
             
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Write in one call to a temp file, then swap it in atomically
+            tmp_path = config_path.with_suffix('.tmp')
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, config_path)
             
             self.logger.info(f"Saved profile-specific settings for: {profile_name}")
         except Exception as e:
@@ -172,10 +202,11 @@ class ProfileConfigManager:
     def delete_profile_config(self, profile_name: str):
         """Delete profile-specific configuration"""
         config_path = self.get_profile_config_path(profile_name)
-        if config_path.exists():
-            try:
-                config_path.unlink()
-                self.logger.info(f"Deleted profile config for: {profile_name}")
-            except Exception as e:
-                self.logger.error(f"Failed to delete profile config for {profile_name}: {e}")
+        try:
+            config_path.unlink()
+            self.logger.info(f"Deleted profile config for: {profile_name}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.error(f"Failed to delete profile config for {profile_name}: {e}")
 
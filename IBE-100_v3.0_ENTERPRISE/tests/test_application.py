@@ -0,0 +1,105 @@
+"""
+Unit tests for the application framework service registry
+"""
+
+import unittest
+import sys
+import json
+import importlib
+import logging
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.core.application import Application
+
+
+class TestServiceRegistry(unittest.TestCase):
+    """Test eager and lazy service registration"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = TemporaryDirectory()
+        config_path = Path(self.temp_dir.name) / "app_config.json"
+        config_path.write_text(json.dumps({"log_dir": str(Path(self.temp_dir.name) / "logs")}))
+        self.app = Application(config_path)
+    
+    def tearDown(self):
+        """Clean up"""
+        self.temp_dir.cleanup()
+    
+    def test_lazy_service_created_once_on_first_use(self):
+        """Test lazy factory runs on first get_service only"""
+        calls = []
+        self.app.register_lazy_service("lazy", lambda: calls.append(1) or object())
+        
+        self.assertTrue(self.app.has_service("lazy"))
+        self.assertEqual(calls, [])
+        
+        service = self.app.get_service("lazy")
+        self.assertIs(self.app.get_service("lazy"), service)
+        self.assertEqual(calls, [1])
+    
+    def test_unknown_service(self):
+        """Test unknown services are reported missing"""
+        self.assertFalse(self.app.has_service("missing"))
+        self.assertIsNone(self.app.get_service("missing"))
+    
+    def test_register_service_replaces_lazy_factory(self):
+        """Test an eager registration wins over a pending factory"""
+        service = object()
+        self.app.register_lazy_service("svc", lambda: self.fail("factory should not run"))
+        self.app.register_service("svc", service)
+        
+        self.assertIs(self.app.get_service("svc"), service)
+    
+    def test_failed_factory_can_be_retried(self):
+        """Test a factory that raises stays registered"""
+        attempts = []
+        
+        def factory():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("not ready")
+            return "ready"
+        
+        self.app.register_lazy_service("flaky", factory)
+        with self.assertRaises(RuntimeError):
+            self.app.get_service("flaky")
+        self.assertEqual(self.app.get_service("flaky"), "ready")
+
+
+class TestEnterpriseServiceRegistration(unittest.TestCase):
+    """Test main_enterprise registers its lazy services"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = TemporaryDirectory()
+        config_path = Path(self.temp_dir.name) / "app_config.json"
+        config_path.write_text(json.dumps({"log_dir": str(Path(self.temp_dir.name) / "logs")}))
+        self.app = Application(config_path)
+        self.main_enterprise = importlib.import_module("main_enterprise")
+    
+    def tearDown(self):
+        """Clean up"""
+        self.temp_dir.cleanup()
+    
+    def test_every_service_spec_registered(self):
+        """Test register_lazy_services registers each SERVICE_SPECS name without creating it"""
+        with mock.patch.object(importlib, "import_module", wraps=importlib.import_module) as import_module:
+            self.main_enterprise.register_lazy_services(self.app, None, logging.getLogger(__name__))
+            
+            for name in self.main_enterprise.SERVICE_SPECS:
+                self.assertTrue(self.app.has_service(name), name)
+            import_module.assert_not_called()
+            
+            # The service module is only imported on first use
+            self.assertIsNotNone(self.app.get_service("monitoring"))
+            import_module.assert_called_once_with("src.services.monitoring_service")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+Unit tests for backup manager
+"""
+
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.utils.backup_manager import BackupManager
+
+
+class TestBackupManager(unittest.TestCase):
+    """Test backup manager"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.source_dir = self.temp_dir / "config"
+        (self.source_dir / "nested").mkdir(parents=True)
+        (self.source_dir / "app_config.json").write_text('{"a": 1}')
+        (self.source_dir / "nested" / "profile.json").write_text('{"b": 2}')
+        self.db_path = self.temp_dir / "sessions.db"
+        self.db_path.write_bytes(b"SQLite format 3\x00" + b"\x01" * 4096)
+        self.manager = BackupManager(backup_dir=self.temp_dir / "backups", max_backups=2)
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_backup_config_copies_tree(self):
+        """Test configuration backup copies nested files"""
+        backup_path = self.manager.backup_config(self.source_dir)
+        self.assertIsNotNone(backup_path)
+        self.assertEqual((backup_path / "app_config.json").read_text(), '{"a": 1}')
+        self.assertEqual((backup_path / "nested" / "profile.json").read_text(), '{"b": 2}')
+    
+    def test_backup_config_link_snapshot(self):
+        """Test hard-link snapshots share inodes with the source files"""
+        source_file = self.source_dir / "nested" / "profile.json"
+        backup_path = self.manager.backup_config(self.source_dir, link=True)
+        self.assertIsNotNone(backup_path)
+        backup_file = backup_path / "nested" / "profile.json"
+        self.assertEqual(backup_file.read_text(), '{"b": 2}')
+        self.assertEqual(backup_file.stat().st_ino, source_file.stat().st_ino)
+    
+    def test_link_snapshot_python_fallback(self):
+        """Test the os.link walk used when cp -al is unavailable"""
+        target = self.temp_dir / "linked"
+        target.mkdir()
+        with mock.patch.object(sys, "platform", "win32"):
+            self.manager._link_copytree(self.source_dir, target)
+        self.assertEqual((target / "nested" / "profile.json").read_text(), '{"b": 2}')
+        self.assertEqual((target / "app_config.json").read_text(), '{"a": 1}')
+    
+    def test_backup_database_preserves_content(self):
+        """Test database backup is byte-identical and keeps mtime"""
+        backup_path = self.manager.backup_database(self.db_path)
+        self.assertIsNotNone(backup_path)
+        self.assertEqual(backup_path.read_bytes(), self.db_path.read_bytes())
+        self.assertAlmostEqual(backup_path.stat().st_mtime, self.db_path.stat().st_mtime, places=3)
+    
+    @unittest.skipUnless(sys.platform.startswith("linux"), "copy_file_range path is Linux-only")
+    def test_short_copy_file_range_is_completed(self):
+        """Test a copy_file_range loop that stops early still yields a full copy"""
+        import fcntl
+        real_copy_file_range = os.copy_file_range
+        calls = []
+        
+        def short_copy(src_fd, dst_fd, count):
+            calls.append(count)
+            return real_copy_file_range(src_fd, dst_fd, 100) if len(calls) == 1 else 0
+        
+        dst = self.temp_dir / "copy.db"
+        with mock.patch.object(fcntl, "ioctl", side_effect=OSError), \
+                mock.patch.object(os, "copy_file_range", side_effect=short_copy):
+            self.manager._clone_file(self.db_path, dst)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(dst.read_bytes(), self.db_path.read_bytes())
+    
+    def test_full_backup(self):
+        """Test full backup contains database, config and profiles"""
+        backup_path = self.manager.create_full_backup(self.db_path, self.source_dir, self.source_dir)
+        self.assertIsNotNone(backup_path)
+        self.assertEqual((backup_path / "database.db").read_bytes(), self.db_path.read_bytes())
+        self.assertTrue((backup_path / "config" / "nested" / "profile.json").exists())
+        self.assertTrue((backup_path / "profiles" / "app_config.json").exists())
+    
+    def test_cleanup_keeps_most_recent(self):
+        """Test old backups beyond max_backups are removed, newest first"""
+        for i in range(4):
+            path = self.manager.backup_dir / f"database_2024010{i}_000000.db"
+            path.write_bytes(b"x")
+            os.utime(path, (1000 + i, 1000 + i))
+        self.manager._cleanup_old_backups("database_")
+        backups = self.manager.list_backups("database")
+        self.assertEqual([p.name for p in backups], [
+            "database_20240103_000000.db", "database_20240102_000000.db"
+        ])
+    
+    def test_list_backups_sees_external_changes(self):
+        """Test a cached listing is dropped once the backup directory changes"""
+        backup_dir = self.manager.backup_dir
+        (backup_dir / "database_20240101_000000.db").write_bytes(b"x")
+        os.utime(backup_dir, (1000, 1000))
+        self.assertEqual(len(self.manager.list_backups("database")), 1)
+        
+        (backup_dir / "database_20240102_000000.db").write_bytes(b"x")
+        self.assertEqual(len(self.manager.list_backups("database")), 2)
+        
+        os.utime(backup_dir, (2000, 2000))
+        self.manager.list_backups("database")
+        (backup_dir / "database_20240101_000000.db").unlink()
+        self.assertEqual(len(self.manager.list_backups("database")), 1)
+    
+    def test_missing_source_returns_none(self):
+        """Test backing up a missing directory returns None"""
+        self.assertIsNone(self.manager.backup_config(self.temp_dir / "missing"))
+        self.assertIsNone(self.manager.backup_database(self.temp_dir / "missing.db"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+"""
+Unit tests for helper utilities
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.utils.helpers import sanitize_filename, format_duration, format_bytes
+
+
+class TestHelpers(unittest.TestCase):
+    """Test helper utilities"""
+    
+    def test_sanitize_filename(self):
+        """Test filename sanitization"""
+        self.assertEqual(sanitize_filename('a<b>c:d"e/f\\g|h?i*j'), "a_b_c_d_e_f_g_h_i_j")
+        self.assertEqual(sanitize_filename("  name. "), "name")
+        self.assertEqual(len(sanitize_filename("x" * 300)), 255)
+    
+    def test_format_duration(self):
+        """Test duration formatting"""
+        self.assertEqual(format_duration(45.9), "45s")
+        self.assertEqual(format_duration(125), "2m 5s")
+        self.assertEqual(format_duration(3725), "1h 2m 5s")
+        self.assertEqual(format_duration(90061), "1d 1h 1m")
+    
+    def test_format_bytes(self):
+        """Test byte count formatting"""
+        self.assertEqual(format_bytes(0), "0.00 B")
+        self.assertEqual(format_bytes(1023), "1023.00 B")
+        self.assertEqual(format_bytes(1536), "1.50 KB")
+        self.assertEqual(format_bytes(1024 ** 3), "1.00 GB")
+        self.assertEqual(format_bytes(2 * 1024 ** 6), "2048.00 PB")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,9 +2,10 @@
 Performance benchmarks and tests
 """
 
+import gc
 import unittest
 import sys
-import time
+import timeit
 from pathlib import Path
 
 # Add src to path
@@ -17,36 +18,47 @@ from src.utils.rate_limiter import RateLimiter
 class TestPerformance(unittest.TestCase):
     """Performance benchmarks"""
     
+    def setUp(self):
+        """Keep garbage collection pauses out of the timings"""
+        gc.disable()
+    
+    def tearDown(self):
+        """Re-enable garbage collection"""
+        gc.enable()
+    
     def test_validator_performance(self):
         """Test validator performance"""
-        iterations = 1000
+        iterations = 10000
         
-        start = time.time()
-        for _ in range(iterations):
+        def run_validators():
             validate_url("http://example.com/test")
             validate_port(8080)
             validate_event_id(10023)
-        elapsed = time.time() - start
         
-        # Should complete 3000 validations in under 1 second
-        self.assertLess(elapsed, 1.0, f"Validators too slow: {elapsed:.3f}s for {iterations * 3} operations")
-        ops_per_sec = (iterations * 3) / elapsed
-        print(f"\n  Validator performance: {ops_per_sec:.0f} operations/second")
+        # Best of several repeats filters scheduler noise
+        elapsed = min(timeit.repeat(run_validators, number=iterations, repeat=3))
+        ns_per_op = elapsed / (iterations * 3) * 1e9
+        
+        # Each validation should take well under 333 microseconds
+        self.assertLess(ns_per_op, 333_000, f"Validators too slow: {ns_per_op:.0f}ns per operation")
+        print(f"\n  Validator performance: {ns_per_op:.0f} ns/operation")
     
     def test_rate_limiter_performance(self):
         """Test rate limiter performance"""
         limiter = RateLimiter(max_requests=1000, window_seconds=60)
         iterations = 1000
+        clients = [f"client_{i}" for i in range(10)]
+        counter = iter(range(iterations))
+        
+        def check_limit():
+            limiter.is_allowed(clients[next(counter) % 10])
         
-        start = time.time()
-        for i in range(iterations):
-            limiter.is_allowed(f"client_{i % 10}")
-        elapsed = time.time() - start
+        elapsed = timeit.timeit(check_limit, number=iterations)
+        ns_per_op = elapsed / iterations * 1e9
         
-        # Should complete 1000 checks in under 0.5 seconds
-        self.assertLess(elapsed, 0.5, f"Rate limiter too slow: {elapsed:.3f}s for {iterations} operations")
-        ops_per_sec = iterations / elapsed
-        print(f"\n  Rate limiter performance: {ops_per_sec:.0f} operations/second")
+        # Each check should take under 500 microseconds
+        self.assertLess(ns_per_op, 500_000, f"Rate limiter too slow: {ns_per_op:.0f}ns per operation")
+        print(f"\n  Rate limiter performance: {ns_per_op:.0f} ns/operation")
     
     def test_memory_usage(self):
         """Test memory usage of validators"""